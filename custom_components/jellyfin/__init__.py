@@ -2,18 +2,23 @@
 
 import asyncio
 import collections.abc
-import json
+import concurrent.futures
+import functools
+import itertools
 import logging
-import time
-import traceback
+import sys
 import uuid
+from collections import ChainMap
 from datetime import timedelta
 from collections.abc import Mapping
-from typing import Any, TypedDict, cast
+from typing import Any, NamedTuple, TypedDict, cast
+from urllib.parse import urlencode
 
-import dateutil.parser as dt
+import aiohttp
 import homeassistant.helpers.config_validation as cv  # pylint: disable=import-error
 import voluptuous as vol
+from aiohttp.hdrs import AUTHORIZATION
+from dateutil.parser import parse as parse_datetime
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (  # pylint: disable=import-error
     ATTR_ENTITY_ID,
@@ -21,14 +26,19 @@ from homeassistant.const import (  # pylint: disable=import-error
     CONF_URL,
     EVENT_HOMEASSISTANT_STOP,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import entity_registry
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.dispatcher import (  # pylint: disable=import-error
     async_dispatcher_send,
 )
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.async_ import create_eager_task
 from jellyfin_apiclient_python import JellyfinClient
+from pydantic import TypeAdapter
 
 from .const import (
     ATTR_PAGE,
@@ -38,12 +48,14 @@ from .const import (
     DOMAIN,
     PLAYABLE_ITEM_TYPES,
     PLAYLISTS,
+    PLAYLISTS_BY_NAME,
     SERVICE_BROWSE,
     SERVICE_DELETE,
     SERVICE_SCAN,
     SERVICE_SEARCH,
     SERVICE_YAMC_SETPAGE,
     SERVICE_YAMC_SETPLAYLIST,
+    SIGNAL_DATA_UPDATED,
     SIGNAL_STATE_UPDATED,
     STATE_IDLE,
     STATE_OFF,
@@ -58,6 +70,7 @@ from .const import (
     YAMC_PAGE_SIZE,
 )
 from .models import (
+    BaseItemDto,
     BaseItemDtoQueryResult,
     JellyfinEntryData,
     MediaSourceInfo,
@@ -76,6 +89,15 @@ from .url import normalize_server_url
 _LOGGER = logging.getLogger(__name__)
 
 
+class _ItemSummary(NamedTuple):
+    """Card fields derived identically for Upcoming and YAMC items."""
+
+    number: str | None
+    studios: str | None
+    genres: str | None
+    runtime: int | None
+
+
 class _SessionsEventData(TypedDict):
     """WebSocket event data for Sessions events."""
 
@@ -83,6 +105,136 @@ class _SessionsEventData(TypedDict):
 
 
 PLATFORMS = ["sensor", "media_player"]
+
+# Validates a whole Sessions payload in one pydantic-core call
+_SESSIONS_ADAPTER = TypeAdapter(list[SessionInfoDto])
+
+# Artwork URL as the SDK's jellyfin.artwork(item_id, type, 500) builds it; the
+# query (including the api_key servers may require for images) is filled in
+# on login
+_ARTWORK_URL_TEMPLATE = "{server}/Items/{{}}/Images/{{}}?{query}"
+
+# PLAYLISTS never changes at runtime, so serialize it once for the YAMC card
+_PLAYLISTS_JSON = json_dumps(PLAYLISTS)
+
+# Header entries prepended to every Upcoming and YAMC card payload
+_UPCOMING_DEFAULTS = UpcomingCardDefaults(
+    title_default="$title",
+    line1_default="$episode",
+    line2_default="$release",
+    line3_default="$rating - $runtime",
+    line4_default="$number - $studio",
+    icon="mdi:arrow-down-bold-circle",
+)
+_YAMC_DEFAULTS = YamcCardDefaults(
+    title_default="$title",
+    line1_default="$tagline",
+    line2_default="$empty",
+    line3_default="$release - $genres",
+    line4_default="$runtime - $rating - $info",
+    line5_default="$date",
+    text_link_default="$info_url",
+    link_default="$stream_url",
+)
+
+# Jellyfin durations are in 100ns ticks
+_TICKS_PER_MINUTE = 10_000_000 * 60
+
+# media_content_type values that resolve to audio streams
+_AUDIO_KINDS = frozenset({"Audio", "track"})
+
+# Reconnect delays in seconds: doubling from 1, then capped
+_RECONNECT_BACKOFF = (1, 2, 4, 8, 16, 32, 64)
+_RECONNECT_BACKOFF_MAX = 100
+
+# Seconds to wait for further Sessions pushes before updating devices
+_SESSIONS_COALESCE_DELAY = 0.1
+
+# Date formats used by the Upcoming and YAMC card payloads
+_FMT_DMY = "%d/%m/%Y"
+_FMT_Y = "%Y"
+
+# Minimum seconds between sensor refreshes triggered by library events
+_SENSOR_REFRESH_COOLDOWN = 2.0
+
+# Upper bound on a single remote control or library command request
+_COMMAND_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Client settings shared by every JellyfinClient this integration creates
+_CLIENT_CONFIG: Mapping[str, object] = {
+    "app.default": True,
+    "app.name": USER_APP_NAME,
+    "app.version": CLIENT_VERSION,
+}
+
+# Device profile sent with PlaybackInfo requests when resolving stream URLs
+_STREAM_PROFILE: Mapping[str, object] = {
+    "Name": USER_APP_NAME,
+    "MaxStreamingBitrate": 25000 * 1000,
+    "MusicStreamingTranscodingBitrate": 1920000,
+    "TimelineOffsetSeconds": 5,
+    "TranscodingProfiles": [
+        {
+            "Type": "Audio",
+            "Container": "mp3",
+            "Protocol": "http",
+            "AudioCodec": "mp3",
+            "MaxAudioChannels": "2",
+        },
+        {
+            "Type": "Video",
+            "Container": "mp4",
+            "Protocol": "http",
+            "AudioCodec": "aac,mp3,opus,flac,vorbis",
+            "VideoCodec": "h264,mpeg4,mpeg2video",
+            "MaxAudioChannels": "6",
+        },
+        {"Container": "jpeg", "Type": "Photo"},
+    ],
+    "DirectPlayProfiles": [
+        {"Type": "Audio", "Container": "mp3", "AudioCodec": "mp3"},
+        {"Type": "Audio", "Container": "m4a,m4b", "AudioCodec": "aac"},
+        {
+            "Type": "Video",
+            "Container": "mp4,m4v",
+            "AudioCodec": "aac,mp3,opus,flac,vorbis",
+            "VideoCodec": "h264,mpeg4,mpeg2video",
+            "MaxAudioChannels": "6",
+        },
+    ],
+    "ResponseProfiles": [],
+    "ContainerProfiles": [],
+    "CodecProfiles": [],
+    "SubtitleProfiles": [
+        {"Format": "srt", "Method": "External"},
+        {"Format": "srt", "Method": "Embed"},
+        {"Format": "ass", "Method": "External"},
+        {"Format": "ass", "Method": "Embed"},
+        {"Format": "sub", "Method": "Embed"},
+        {"Format": "sub", "Method": "External"},
+        {"Format": "ssa", "Method": "Embed"},
+        {"Format": "ssa", "Method": "External"},
+        {"Format": "smi", "Method": "Embed"},
+        {"Format": "smi", "Method": "External"},
+        # Jellyfin currently refuses to serve these subtitle types as external.
+        {"Format": "pgssub", "Method": "Embed"},
+        # {
+        #    "Format": "pgssub",
+        #    "Method": "External"
+        # },
+        {"Format": "dvdsub", "Method": "Embed"},
+        # {
+        #    "Format": "dvdsub",
+        #    "Method": "External"
+        # },
+        {"Format": "pgs", "Method": "Embed"},
+        # {
+        #    "Format": "pgs",
+        #    "Method": "External"
+        # }
+    ],
+}
+
 _update_unlistener: collections.abc.Callable[[], None] | None = None
 MIN_TIME_BETWEEN_UPDATES = timedelta(minutes=30)
 
@@ -116,38 +268,27 @@ BROWSE_SERVICE_SCHEMA = SERVICE_SCHEMA.extend(
 )
 
 
-class _ServiceDef(TypedDict):
-    method: str
-    schema: vol.Schema
-
-
-SERVICE_TO_METHOD: dict[str, _ServiceDef] = {
-    SERVICE_SCAN: {"method": "async_trigger_scan", "schema": SCAN_SERVICE_SCHEMA},
-    SERVICE_BROWSE: {"method": "async_browse_item", "schema": BROWSE_SERVICE_SCHEMA},
-    SERVICE_DELETE: {"method": "async_delete_item", "schema": DELETE_SERVICE_SCHEMA},
-    SERVICE_SEARCH: {"method": "async_search_item", "schema": SEARCH_SERVICE_SCHEMA},
-    SERVICE_YAMC_SETPAGE: {
-        "method": "async_yamc_setpage",
-        "schema": YAMC_SETPAGE_SERVICE_SCHEMA,
-    },
-    SERVICE_YAMC_SETPLAYLIST: {
-        "method": "async_yamc_setplaylist",
-        "schema": YAMC_SETPLAYLIST_SERVICE_SCHEMA,
-    },
+# Service name -> (entity method name, service schema)
+SERVICE_TO_METHOD: dict[str, tuple[str, vol.Schema]] = {
+    SERVICE_SCAN: ("async_trigger_scan", SCAN_SERVICE_SCHEMA),
+    SERVICE_BROWSE: ("async_browse_item", BROWSE_SERVICE_SCHEMA),
+    SERVICE_DELETE: ("async_delete_item", DELETE_SERVICE_SCHEMA),
+    SERVICE_SEARCH: ("async_search_item", SEARCH_SERVICE_SCHEMA),
+    SERVICE_YAMC_SETPAGE: ("async_yamc_setpage", YAMC_SETPAGE_SERVICE_SCHEMA),
+    SERVICE_YAMC_SETPLAYLIST: (
+        "async_yamc_setplaylist",
+        YAMC_SETPLAYLIST_SERVICE_SCHEMA,
+    ),
 }
 
 
 def autolog(message: str) -> None:
     "Automatically log the current function details."
-    import inspect
-
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        return
     # Get the previous frame in the stack, otherwise it would
     # be this function!!!
-    frame = inspect.currentframe()
-    if frame is None or frame.f_back is None:
-        _LOGGER.debug("%s: <unknown frame>", message)
-        return
-    func = frame.f_back.f_code
+    func = sys._getframe(1).f_code  # pylint: disable=protected-access
     # Dump the message + the name of this function to the log.
     _LOGGER.debug(
         "%s: %s in %s:%i",
@@ -155,6 +296,94 @@ def autolog(message: str) -> None:
     )
 
 
+def _session_play_state(session: SessionInfoDto) -> str:
+    """Return the playstate of an active session."""
+    if session.NowPlayingItem is None:
+        return STATE_IDLE
+    if session.PlayState is not None and session.PlayState.IsPaused:
+        return STATE_PAUSED
+    return STATE_PLAYING
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_date(value: str, fmt: str) -> str:
+    """Format a Jellyfin date string, memoized across card refreshes."""
+    return parse_datetime(value).strftime(fmt)
+
+
+# Item Type -> (ProviderIds key, external info URL template)
+_INFO_URL: dict[str, tuple[str, str]] = {
+    "Movie": ("Imdb", "https://trakt.tv/search/imdb/{}?id_type=movie"),
+    "Series": ("Imdb", "https://trakt.tv/search/imdb/{}?id_type=series"),
+    "Episode": ("Imdb", "https://trakt.tv/search/imdb/{}?id_type=episode"),
+    "MusicAlbum": ("MusicBrainzAlbum", "https://musicbrainz.org/album/{}"),
+    "MusicArtist": ("MusicBrainzArtist", "https://musicbrainz.org/artist/{}"),
+}
+
+# (episode, tagline, release, fanart type, whether played state is shown)
+_YamcTypeFields = tuple[str | None, str | None, str | None, str, bool]
+
+
+def _yamc_movie_fields(item: BaseItemDto) -> _YamcTypeFields:
+    tagline = item.Taglines[0] if item.Taglines else ""
+    release = _format_date(item.PremiereDate, _FMT_Y) if item.PremiereDate else None
+    return None, tagline, release, "Backdrop", True
+
+
+def _yamc_series_fields(item: BaseItemDto) -> _YamcTypeFields:
+    release = _format_date(item.PremiereDate, _FMT_DMY) if item.PremiereDate else None
+    return item.Name, item.Name, release, "Backdrop", True
+
+
+def _yamc_episode_fields(item: BaseItemDto) -> _YamcTypeFields:
+    release = _format_date(item.PremiereDate, _FMT_DMY) if item.PremiereDate else None
+    return item.Name, item.Name, release, "Primary", True
+
+
+def _yamc_music_album_fields(item: BaseItemDto) -> _YamcTypeFields:
+    tagline = ",".join(item.Artists) if item.Artists else None
+    release = _format_date(item.PremiereDate, _FMT_Y) if item.PremiereDate else None
+    return None, tagline, release, "Primary", False
+
+
+def _yamc_music_artist_fields(item: BaseItemDto) -> _YamcTypeFields:
+    tagline = ",".join(item.Artists) if item.Artists else None
+    release = _format_date(item.DateCreated, _FMT_Y) if item.DateCreated else None
+    return None, tagline, release, "Primary", False
+
+
+def _yamc_default_fields(item: BaseItemDto) -> _YamcTypeFields:
+    release = _format_date(item.PremiereDate, _FMT_DMY) if item.PremiereDate else None
+    return item.Name, item.Name, release, "Primary", False
+
+
+# Per-type YAMC field builders, keyed by Jellyfin item Type
+_YAMC_TYPE_HANDLERS: dict[
+    str, collections.abc.Callable[[BaseItemDto], _YamcTypeFields]
+] = {
+    "Movie": _yamc_movie_fields,
+    "Series": _yamc_series_fields,
+    "Episode": _yamc_episode_fields,
+    "MusicAlbum": _yamc_music_album_fields,
+    "MusicArtist": _yamc_music_artist_fields,
+}
+
+
+def _source_weight(source: MediaSourceInfo) -> tuple[bool, int]:
+    """Rank a media source, preferring direct streams then higher bitrates."""
+    return (bool(source.SupportsDirectStream), source.Bitrate or 0)
+
+
+def _run_device_callback(
+    device_callback: collections.abc.Callable[[object], None], msg: object
+) -> None:
+    """Run one device callback so a failing entity cannot stop the others."""
+    try:
+        device_callback(msg)
+    except Exception:
+        _LOGGER.exception("Error in device callback %s for %s", device_callback, msg)
+
+
 async def async_setup(hass: HomeAssistant, config: Mapping[str, object]) -> bool:
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
@@ -177,18 +406,24 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             config_entry, unique_id=config_entry.title
         )
 
-    # Merge entry data and options, then validate as JellyfinEntryData
-    config_dict: dict[str, object] = dict(config_entry.data)
-    config_dict.update(config_entry.options)
+    # Overlay options on entry data, then validate as JellyfinEntryData. The
+    # merged dict is only materialized when options need to be persisted.
+    merged_config = ChainMap(config_entry.options, config_entry.data)
+    config = JellyfinEntryData.model_validate(merged_config)
     if config_entry.options:
-        hass.config_entries.async_update_entry(config_entry, data=config_dict, options={})
-
-    config = JellyfinEntryData.model_validate(config_dict)
+        hass.config_entries.async_update_entry(
+            config_entry, data=dict(merged_config), options={}
+        )
 
     _update_unlistener = config_entry.add_update_listener(_update_listener)
 
     hass.data[DOMAIN][config.url] = {
         "entry_id": config_entry.entry_id,
+        # Effective configuration, compared by _update_listener to skip
+        # reloads when nothing changed
+        "config_key": frozenset(merged_config.items()),
+        # Entities exposing service methods, keyed by entity_id
+        "entities_by_id": {},
     }
     _jelly = JellyfinClientManager(hass, config)
     _jelly.entry_id = config_entry.entry_id
@@ -199,46 +434,25 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         _LOGGER.error("Cannot connect to Jellyfin server.")
         raise ConfigEntryNotReady
 
-    async def async_service_handler(service: object) -> None:
-        """Map services to methods"""
-        service_name = getattr(service, "service", None)
-        service_data = getattr(service, "data", {})
-        method = SERVICE_TO_METHOD.get(service_name) if service_name else None
-        if method is None:
-            _LOGGER.warning("Unknown service: %s", service_name)
-            return
-
-        method_name = method["method"]
-        params = {
-            key: value for key, value in service_data.items() if key != "entity_id"
-        }
-
-        entity_id = service_data.get(ATTR_ENTITY_ID)
-
-        for sensor in hass.data[DOMAIN][config.url]["sensor"]["entities"]:
-            if sensor.entity_id == entity_id:
-                await getattr(sensor, method_name)(**params)
-
-        for media_player in hass.data[DOMAIN][config.url]["media_player"][
-            "entities"
-        ]:
-            if media_player.entity_id == entity_id:
-                await getattr(media_player, method_name)(**params)
-
-    for my_service in SERVICE_TO_METHOD:
-        schema = SERVICE_TO_METHOD[my_service].get("schema", SERVICE_SCHEMA)
+    # Each service gets the module-level handler with its target map and
+    # method name pre-bound
+    entities_by_id = hass.data[DOMAIN][config.url]["entities_by_id"]
+    for my_service, (method_name, schema) in SERVICE_TO_METHOD.items():
         hass.services.async_register(
-            DOMAIN, my_service, async_service_handler, schema=schema
+            DOMAIN,
+            my_service,
+            functools.partial(_async_handle_service, entities_by_id, method_name),
+            schema=schema,
         )
 
     # Start the client and fetch server info BEFORE setting up entity platforms.
     # This ensures _info is available when entities access device_info during registration.
     await _jelly.start()
 
-    for platform in PLATFORMS:
-        hass.data[DOMAIN][config.url][platform] = {}
-        hass.data[DOMAIN][config.url][platform]["entities"] = []
-        await hass.config_entries.async_forward_entry_setups(config_entry, [platform])
+    hass.data[DOMAIN][config.url].update(
+        {platform: {"entities": []} for platform in PLATFORMS}
+    )
+    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
     async_dispatcher_send(hass, SIGNAL_STATE_UPDATED)
 
@@ -251,16 +465,22 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     return True
 
 
+async def _async_handle_service(
+    entities_by_id: dict[str, object], method_name: str, service: ServiceCall
+) -> None:
+    """Call method_name on the service's target entity."""
+    params = dict(service.data)
+    entity_id = params.pop(ATTR_ENTITY_ID, None)
+    entity = entities_by_id.get(entity_id)
+    if entity is not None:
+        await getattr(entity, method_name)(**params)
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     _LOGGER.info("Unloading jellyfin")
 
-    unload_ok = all(
-        await asyncio.gather(
-            *[
-                hass.config_entries.async_forward_entry_unload(config_entry, component)
-                for component in PLATFORMS
-            ]
-        )
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        config_entry, PLATFORMS
     )
 
     _jelly: JellyfinClientManager = hass.data[DOMAIN][config_entry.data.get(CONF_URL)][
@@ -273,6 +493,11 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
 async def _update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Update listener."""
+    entry_data = hass.data[DOMAIN].get(config_entry.data.get(CONF_URL), {})
+    config_key = frozenset(ChainMap(config_entry.options, config_entry.data).items())
+    if entry_data.get("config_key") == config_key:
+        _LOGGER.debug("config unchanged, skipping reload")
+        return
     _LOGGER.debug("reload triggered")
     await hass.config_entries.async_reload(config_entry.entry_id)
 
@@ -297,7 +522,7 @@ class JellyfinDevice:
         self.jf_manager = jf_manager
         self.is_active = True
         self._device_key = device_key
-        self.session = session
+        self.update_session(session)
 
     @property
     def device_key(self) -> str:
@@ -305,12 +530,52 @@ class JellyfinDevice:
         return self._device_key
 
     def update_session(self, session: SessionInfoDto) -> None:
-        """Update session object."""
+        """Update session object and the values derived from it."""
         self.session = session
+        now_playing = session.NowPlayingItem
+        play_state = session.PlayState
+
+        position_ticks = play_state.PositionTicks if play_state is not None else None
+        self._media_position = (
+            position_ticks / 10000000 if position_ticks is not None else None
+        )
+        runtime_ticks = now_playing.RunTimeTicks if now_playing is not None else None
+        self._media_runtime = (
+            runtime_ticks / 10000000 if runtime_ticks is not None else None
+        )
+        if self._media_position is None or not self._media_runtime:
+            self._media_percent_played = None
+        else:
+            self._media_percent_played = (
+                self._media_position / self._media_runtime
+            ) * 100
+
+        artists = now_playing.Artists if now_playing is not None else None
+        self._media_artist = artists[0] if artists else None
+
+        image_tags = now_playing.image_tags if now_playing is not None else None
+        if image_tags is None:
+            self._media_image_type = None
+        elif image_tags.Thumb is not None:
+            self._media_image_type = "Thumb"
+        elif image_tags.Primary is not None:
+            self._media_image_type = "Primary"
+        else:
+            self._media_image_type = None
+
+        self._play_state = _session_play_state(session)
+        self._update_state()
 
     def set_active(self, active: bool) -> None:
         """Mark device as on/off."""
         self.is_active = active
+        self._update_state()
+
+    def _update_state(self) -> None:
+        """Recompute the playstate from the activity flag and session."""
+        # Drop the cached image url; it depends on both
+        self.__dict__.pop("media_image_url", None)
+        self._state = self._play_state if self.is_active else STATE_OFF
 
     @property
     def session_id(self) -> str:
@@ -351,134 +616,87 @@ class JellyfinDevice:
     @property
     def media_title(self) -> str | None:
         """Return title currently playing."""
-        if self.session.NowPlayingItem is None:
-            return None
-        return self.session.NowPlayingItem.Name
+        now_playing = self.session.NowPlayingItem
+        return now_playing.Name if now_playing is not None else None
 
     @property
     def media_season(self) -> int | None:
         """Season of current playing media (TV Show only)."""
-        if self.session.NowPlayingItem is None:
-            return None
-        return self.session.NowPlayingItem.ParentIndexNumber
+        now_playing = self.session.NowPlayingItem
+        return now_playing.ParentIndexNumber if now_playing is not None else None
 
     @property
     def media_series_title(self) -> str | None:
         """The title of the series of current playing media (TV Show only)."""
-        if self.session.NowPlayingItem is None:
-            return None
-        return self.session.NowPlayingItem.SeriesName
+        now_playing = self.session.NowPlayingItem
+        return now_playing.SeriesName if now_playing is not None else None
 
     @property
     def media_episode(self) -> int | None:
         """Episode of current playing media (TV Show only)."""
-        if self.session.NowPlayingItem is None:
-            return None
-        return self.session.NowPlayingItem.IndexNumber
+        now_playing = self.session.NowPlayingItem
+        return now_playing.IndexNumber if now_playing is not None else None
 
     @property
     def media_album_name(self) -> str | None:
         """Album name of current playing media (Music track only)."""
-        if self.session.NowPlayingItem is None:
-            return None
-        return self.session.NowPlayingItem.Album
+        now_playing = self.session.NowPlayingItem
+        return now_playing.Album if now_playing is not None else None
 
     @property
-    def media_artist(self) -> str | list[str] | None:
+    def media_artist(self) -> str | None:
         """Artist of current playing media (Music track only)."""
-        if self.session.NowPlayingItem is None:
-            return None
-        artists = self.session.NowPlayingItem.Artists
-        if artists is None:
-            return None
-        if len(artists) > 1:
-            return artists[0]
-        return artists
+        return self._media_artist
 
     @property
     def media_album_artist(self) -> str | None:
         """Album artist of current playing media (Music track only)."""
-        if self.session.NowPlayingItem is None:
-            return None
-        return self.session.NowPlayingItem.AlbumArtist
+        now_playing = self.session.NowPlayingItem
+        return now_playing.AlbumArtist if now_playing is not None else None
 
     @property
     def media_id(self) -> str | None:
         """Return id of currently playing media."""
-        if self.session.NowPlayingItem is None:
-            return None
-        return self.session.NowPlayingItem.Id
+        now_playing = self.session.NowPlayingItem
+        return now_playing.Id if now_playing is not None else None
 
     @property
     def media_type(self) -> str | None:
         """Return type currently playing."""
-        if self.session.NowPlayingItem is None:
-            return None
-        return self.session.NowPlayingItem.Type
+        now_playing = self.session.NowPlayingItem
+        return now_playing.Type if now_playing is not None else None
 
-    @property
+    @functools.cached_property
     def media_image_url(self) -> str | None:
         """Image url of current playing media."""
-        if not self.is_nowplaying:
-            return None
-        now_playing = self.session.NowPlayingItem
-        if now_playing is None or now_playing.image_tags is None:
+        if not self.is_nowplaying or self._media_image_type is None:
             return None
-
-        image_tags = now_playing.image_tags
-        if image_tags.Thumb is not None:
-            image_type = "Thumb"
-        elif image_tags.Primary is not None:
-            image_type = "Primary"
-        else:
-            return None
-
-        return self.jf_manager.api.artwork(self.media_id, image_type, 500)
+        return self.jf_manager.get_artwork_url(self.media_id, self._media_image_type)
 
     @property
     def media_position(self) -> float | None:
         """Return position currently playing."""
-        if self.session.PlayState is None:
-            return None
-        position_ticks = self.session.PlayState.PositionTicks
-        if position_ticks is None:
-            return None
-        return position_ticks / 10000000
+        return self._media_position
 
     @property
     def media_runtime(self) -> float | None:
         """Return total runtime length."""
-        if self.session.NowPlayingItem is None:
-            return None
-        runtime_ticks = self.session.NowPlayingItem.RunTimeTicks
-        if runtime_ticks is None:
-            return None
-        return runtime_ticks / 10000000
+        return self._media_runtime
 
     @property
     def media_percent_played(self) -> float | None:
         """Return media percent played."""
-        position = self.media_position
-        runtime = self.media_runtime
-        if position is None or runtime is None:
-            return None
-        return (position / runtime) * 100
+        return self._media_percent_played
 
     @property
     def state(self) -> str:
         """Return current playstate of the device."""
-        if not self.is_active:
-            return STATE_OFF
-        if self.session.NowPlayingItem is None:
-            return STATE_IDLE
-        if self.session.PlayState is not None and self.session.PlayState.IsPaused:
-            return STATE_PAUSED
-        return STATE_PLAYING
+        return self._state
 
     @property
     def is_nowplaying(self) -> bool:
         """Return true if an item is currently active."""
-        return self.state not in (STATE_IDLE, STATE_OFF)
+        return self.is_active and self.session.NowPlayingItem is not None
 
     @property
     def supports_remote_control(self) -> bool:
@@ -499,7 +717,7 @@ class JellyfinDevice:
 
     async def set_playstate(self, state: str, pos: float = 0) -> None:
         """Send media commands to server."""
-        params: dict[str, object] = {}
+        params: dict[str, str | int] = {}
         if state == "Seek":
             params["seekPositionTicks"] = int(pos * 10000000)
 
@@ -567,13 +785,41 @@ class JellyfinClientManager:
         self._last_playlist = ""
         self._last_search = ""
         self._yamc_streams: dict[str, dict[str, str | None]] = {}
+        # Bumped whenever the YAMC items or streams change; the built card
+        # attributes are cached against it
+        self._yamc_version = 0
+        self._yamc_cache: tuple[int, object] | None = None
+        # Same for the Upcoming card, bumped whenever _data is replaced
+        self._data_version = 0
+        self._data_cache: tuple[int, UpcomingCardPayload] | None = None
+        # Card fields shared by Upcoming and YAMC, keyed by item id and
+        # cleared whenever update_data swaps in a new item list
+        self._derived_cache: dict[str, _ItemSummary] = {}
 
         self.config = config
-        self.server_url = ""
+
+        # The configured URL never changes for the lifetime of the manager,
+        # so normalize it (and derive the device id) once up front.
+        try:
+            self.server_url = normalize_server_url(config.url)
+        except ValueError:
+            self.server_url = ""
+            self._url_valid = False
+        else:
+            self._url_valid = True
+        # Deterministic device_id derived from the server URL
+        self._device_id = str(uuid.uuid5(uuid.NAMESPACE_URL, self.server_url))
 
         # Cache for thumbnail URLs (media_id -> jellyfin_image_url)
         # Used by the image proxy view to fetch images on behalf of the browser
         self.thumbnail_cache = {}
+        # Artwork URL format string for the current server and token, set on
+        # login
+        self._artwork_url = ""
+        # Commands are sent through Home Assistant's shared aiohttp session
+        # instead of hopping to the executor for the synchronous SDK
+        self._http = async_get_clientsession(hass, verify_ssl=config.verify_ssl)
+        self._auth_headers: dict[str, str] = {}
 
         # Library item counts
         self._movie_count: int | None = None
@@ -582,11 +828,34 @@ class JellyfinClientManager:
 
         self._sessions: list[SessionInfoDto] | None = None
         self._devices: dict[str, JellyfinDevice] = {}
+        # Interned device keys by (UserId, DeviceName), so repeated Sessions
+        # events reuse the same key string
+        self._key_cache: dict[tuple[str, str], str] = {}
+        # Latest Sessions push waiting for the coalescing timer
+        self._sessions_pending: list[dict[str, Any]] | None = None
+        self._sessions_handle: asyncio.TimerHandle | None = None
+        # Last Sessions push applied to the device list
+        self._last_sessions_raw: list[dict[str, Any]] | None = None
+        self._reconnect_future: concurrent.futures.Future[None] | None = None
+        # Collapses bursts of LibraryChanged/UserDataChanged events (e.g.
+        # during a library scan) into one data refresh
+        self._refresh_debouncer: Debouncer[
+            collections.abc.Coroutine[Any, Any, None]
+        ] = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=_SENSOR_REFRESH_COOLDOWN,
+            immediate=True,
+            function=self._async_refresh_data,
+        )
 
         # Callbacks
         self._new_devices_callbacks: list[collections.abc.Callable[[object], None]] = []
         self._stale_devices_callbacks: list[collections.abc.Callable[[object], None]] = []
-        self._update_callbacks: list[tuple[collections.abc.Callable[[object], None], str]] = []
+        # Update callbacks keyed by the device key they listen to
+        self._update_callbacks: collections.defaultdict[
+            str, list[collections.abc.Callable[[object], None]]
+        ] = collections.defaultdict(list)
 
     @property
     def _client(self) -> JellyfinClient:
@@ -595,58 +864,6 @@ class JellyfinClientManager:
             raise RuntimeError("JellyfinClient not initialized - call login() first")
         return self.jf_client
 
-    @staticmethod
-    def expo(max_value: int | None = None) -> collections.abc.Generator[int]:
-        n = 0
-        while True:
-            a = 2**n
-            if max_value is None or a < max_value:
-                yield a
-                n += 1
-            else:
-                yield max_value
-
-    @staticmethod
-    def clean_none_dict_values(obj: object) -> object:
-        """
-        Recursively remove keys with a value of None
-        """
-        if not isinstance(obj, collections.abc.Iterable) or isinstance(obj, str):
-            return obj
-
-        queue = [obj]
-
-        while queue:
-            item = queue.pop()
-
-            if isinstance(item, collections.abc.Mapping):
-                mutable = isinstance(item, collections.abc.MutableMapping)
-                remove = []
-
-                for key, value in item.items():
-                    if value is None and mutable:
-                        remove.append(key)
-
-                    elif isinstance(value, str):
-                        continue
-
-                    elif isinstance(value, collections.abc.Iterable):
-                        queue.append(value)
-
-                if mutable:
-                    # Remove keys with None value
-                    for key in remove:
-                        item.pop(key)
-
-            elif isinstance(item, collections.abc.Iterable):
-                for value in item:
-                    if value is None or isinstance(value, str):
-                        continue
-                    elif isinstance(value, collections.abc.Iterable):
-                        queue.append(value)
-
-        return obj
-
     async def connect(self):
         autolog(">>>")
 
@@ -660,9 +877,7 @@ class JellyfinClientManager:
     @staticmethod
     def client_factory(verify_ssl: bool, device_id: str):
         client = JellyfinClient(allow_multiple_clients=True)
-        client.config.data["app.default"] = True
-        client.config.data["app.name"] = USER_APP_NAME
-        client.config.data["app.version"] = CLIENT_VERSION
+        client.config.data.update(_CLIENT_CONFIG)
         client.config.data["app.device_id"] = device_id
         client.config.data["auth.ssl"] = verify_ssl
         return client
@@ -670,15 +885,13 @@ class JellyfinClientManager:
     def login(self):
         autolog(">>>")
 
-        try:
-            self.server_url = normalize_server_url(self.config.url)
-        except ValueError:
+        if not self._url_valid:
             _LOGGER.error("Invalid Jellyfin URL: %s", self.config.url)
             return False
 
-        # Generate a deterministic device_id from the server URL
-        device_id = str(uuid.uuid5(uuid.NAMESPACE_URL, self.server_url))
-        self.jf_client = self.client_factory(self.config.verify_ssl, device_id)
+        self.jf_client = self.client_factory(self.config.verify_ssl, self._device_id)
+        # The artwork template embeds the previous client's address and token
+        self._artwork_url = ""
         try:
             self._client.authenticate(
                 {
@@ -691,6 +904,15 @@ class JellyfinClientManager:
                 },
                 discover=False,
             )
+            self._artwork_url = _ARTWORK_URL_TEMPLATE.format(
+                server=self.get_server_url(),
+                query=urlencode(
+                    {"MaxWidth": 500, "format": "jpg", "api_key": self.get_auth_token()}
+                ),
+            )
+            self._auth_headers = {
+                AUTHORIZATION: f'MediaBrowser Token="{self.get_auth_token()}"'
+            }
             # Set auth.user_id so {UserId} template substitution works in API calls
             if self.config.library_user_id:
                 self._client.config.data["auth.user_id"] = self.config.library_user_id
@@ -701,44 +923,79 @@ class JellyfinClientManager:
 
         return info is not None
 
+    def _handle_event(self, event_name: str, data: object) -> None:
+        """Handle a client or WebSocket event (called from the client's thread)."""
+        _LOGGER.debug("Event: %s", event_name)
+        if event_name == "WebSocketConnect":
+            self._client.wsc.send("SessionsStart", "0,1500")
+        elif event_name == "WebSocketDisconnect":
+            if self._reconnect_future is None or self._reconnect_future.done():
+                self._reconnect_future = asyncio.run_coroutine_threadsafe(
+                    self._async_reconnect(), self._event_loop
+                )
+        elif event_name in ("LibraryChanged", "UserDataChanged"):
+            self._event_loop.call_soon_threadsafe(
+                self._refresh_debouncer.async_schedule_call
+            )
+        elif event_name == "Sessions":
+            raw = cast(_SessionsEventData, data)["value"]
+            self._event_loop.call_soon_threadsafe(self._queue_sessions, raw)
+        else:
+            self.callback(self._client, event_name, data)
+
+    @callback
+    def _queue_sessions(self, raw: list[dict[str, Any]]) -> None:
+        """Hold a Sessions push until the coalescing window closes."""
+        self._sessions_pending = raw
+        if self._sessions_handle is None:
+            self._sessions_handle = self._event_loop.call_later(
+                _SESSIONS_COALESCE_DELAY, self._flush_sessions
+            )
+
+    @callback
+    def _flush_sessions(self) -> None:
+        """Validate the latest queued Sessions push and refresh the devices."""
+        self._sessions_handle = None
+        raw, self._sessions_pending = self._sessions_pending, None
+        if raw is None:
+            return
+        # Idle servers keep re-pushing the same list; nothing can have changed
+        if raw == self._last_sessions_raw:
+            return
+        self._last_sessions_raw = raw
+        _LOGGER.debug("Sessions (WebSocket): %s", raw)
+        self._sessions = _SESSIONS_ADAPTER.validate_python(raw)
+        self.update_device_list()
+
+    async def _async_reconnect(self) -> None:
+        """Reconnect to the server, backing off exponentially between tries."""
+        for timeout in itertools.chain(
+            _RECONNECT_BACKOFF, itertools.repeat(_RECONNECT_BACKOFF_MAX)
+        ):
+            if self.is_stopping:
+                return
+            _LOGGER.warning(
+                "No connection to server. Next try in %s second(s)", timeout
+            )
+            await self.hass.async_add_executor_job(self._client.stop)
+            await asyncio.sleep(timeout)
+            if self.is_stopping:
+                return
+            if await self.hass.async_add_executor_job(self.login):
+                # stop() may have run while login was in flight; starting the
+                # new client now would leak its websocket thread
+                if self.is_stopping:
+                    return
+                self._client.callback = self._handle_event
+                self._client.callback_ws = self._handle_event
+                await self.hass.async_add_executor_job(self._client.start, True)
+                return
+
     async def start(self):
         autolog(">>>")
 
-        def event(event_name: str, data: object) -> None:
-            _LOGGER.debug("Event: %s", event_name)
-            if event_name == "WebSocketConnect":
-                self._client.wsc.send("SessionsStart", "0,1500")
-            elif event_name == "WebSocketDisconnect":
-                timeout_gen = self.expo(100)
-                while not self.is_stopping:
-                    timeout = next(timeout_gen)
-                    _LOGGER.warning(
-                        "No connection to server. Next try in {0} second(s)".format(
-                            timeout
-                        )
-                    )
-                    self._client.stop()
-                    time.sleep(timeout)
-                    if self.login():
-                        self._client.callback = event
-                        self._client.callback_ws = event
-                        self._client.start(True)
-                        break
-            elif event_name in ("LibraryChanged", "UserDataChanged"):
-                for sensor in self.hass.data[DOMAIN][self.host]["sensor"]["entities"]:
-                    autolog("LibraryChanged: trigger update")
-                    sensor.schedule_update_ha_state(force_refresh=True)
-            elif event_name == "Sessions":
-                cleaned = cast(_SessionsEventData, self.clean_none_dict_values(data))
-                raw = cleaned["value"]
-                _LOGGER.debug("Sessions (WebSocket): %s", raw)
-                self._sessions = [SessionInfoDto.model_validate(s) for s in raw]
-                self.update_device_list()
-            else:
-                self.callback(self._client, event_name, data)
-
-        self._client.callback = event
-        self._client.callback_ws = event
+        self._client.callback = self._handle_event
+        self._client.callback_ws = self._handle_event
 
         await self.hass.async_add_executor_job(self._client.start, True)
         self.is_stopping = False
@@ -749,20 +1006,36 @@ class JellyfinClientManager:
         self._info = SystemInfo.model_validate(raw_info)
         raw_sessions = cast(
             list[dict[str, Any]],
-            self.clean_none_dict_values(
-                await self.hass.async_add_executor_job(self._client.jellyfin._get, "Sessions")
-            ),
+            await self.hass.async_add_executor_job(self._client.jellyfin._get, "Sessions"),
         )
         _LOGGER.debug("Sessions (initial fetch): %s", raw_sessions)
-        self._sessions = [SessionInfoDto.model_validate(s) for s in raw_sessions]
+        self._sessions = _SESSIONS_ADAPTER.validate_python(raw_sessions)
         await self.update_data()
 
     async def stop(self):
         autolog("<<<")
 
         self.is_stopping = True
+        self._refresh_debouncer.async_cancel()
+        if self._reconnect_future is not None:
+            self._reconnect_future.cancel()
+            self._reconnect_future = None
+        if self._sessions_handle is not None:
+            self._sessions_handle.cancel()
+            self._sessions_handle = None
         await self.hass.async_add_executor_job(self._client.stop)
 
+    @property
+    def data_updated_signal(self) -> str:
+        """Dispatcher signal sent after library data is refreshed."""
+        return f"{SIGNAL_DATA_UPDATED}_{self.host}"
+
+    async def _async_refresh_data(self) -> None:
+        """Refresh library data once and tell the sensors to write state."""
+        autolog("LibraryChanged: trigger update")
+        await self.update_data()
+        async_dispatcher_send(self.hass, self.data_updated_signal)
+
     async def _get_item_count(self, item_type: str) -> int:
         """Fetch the total count of items of a given type."""
         query = {
@@ -792,6 +1065,7 @@ class JellyfinClientManager:
                     "Upcoming media enabled but no Jellyfin user configured; skipping update."
                 )
                 self._data = None
+                self._data_version += 1
             else:
                 raw_upcoming = await self.hass.async_add_executor_job(
                     self._client.jellyfin.shows,
@@ -804,6 +1078,10 @@ class JellyfinClientManager:
                     },
                 )
                 self._data = BaseItemDtoQueryResult.model_validate(raw_upcoming)
+                self._data_version += 1
+                # Reset only once the new items are in place; reads during the
+                # awaits above would otherwise re-cache the old items' fields
+                self._derived_cache = {}
 
         if self.config.generate_yamc:
             if not user_id:
@@ -812,6 +1090,7 @@ class JellyfinClientManager:
                 )
                 self._yamc = None
                 self._yamc_streams = {}
+                self._yamc_version += 1
             else:
                 query = {
                     "startIndex": (self._yamc_cur_page - 1) * YAMC_PAGE_SIZE,
@@ -829,9 +1108,9 @@ class JellyfinClientManager:
                 if self._last_search:
                     query["searchTerm"] = self._last_search
                 elif self._last_playlist:
-                    for pl in PLAYLISTS:
-                        if pl["name"] == self._last_playlist:
-                            query.update(pl["query"])
+                    playlist = PLAYLISTS_BY_NAME.get(self._last_playlist)
+                    if playlist is not None:
+                        query.update(playlist["query"])
 
                 if self._last_playlist == "nextup":
                     raw_yamc = await self.hass.async_add_executor_job(
@@ -844,27 +1123,50 @@ class JellyfinClientManager:
 
                 self._yamc = BaseItemDtoQueryResult.model_validate(raw_yamc)
                 self._yamc_streams = {}
-
-                for item in self._yamc.Items:
-                    # Only fetch stream URLs for directly playable types
-                    if item.Type in PLAYABLE_ITEM_TYPES:
-                        stream_url, _, info = await self.get_stream_url(item.Id, item.Type)
-                        self._yamc_streams[item.Id] = {
-                            "stream_url": stream_url,
-                            "info": info,
-                        }
+                self._yamc_version += 1
+                self._derived_cache = {}
+
+                # Only fetch stream URLs for directly playable types. The
+                # lookups are independent, so run them concurrently and store
+                # each result as soon as it arrives. Eager tasks let lookups
+                # that finish without blocking skip a trip through the loop.
+                fetches = [
+                    create_eager_task(self._fetch_yamc_stream(item.Id, item.Type))
+                    for item in self._yamc.Items
+                    if item.Type in PLAYABLE_ITEM_TYPES
+                ]
+                for fetch in asyncio.as_completed(fetches):
+                    item_id, stream = await fetch
+                    if stream is not None:
+                        self._yamc_streams[item_id] = stream
+                self._yamc_version += 1
+
+    async def _fetch_yamc_stream(
+        self, item_id: str, item_type: str
+    ) -> tuple[str, dict[str, str | None] | None]:
+        """Fetch the stream URL and info of a YAMC item, tagged with its id."""
+        try:
+            stream_url, _, info = await self.get_stream_url(item_id, item_type)
+        except Exception:
+            _LOGGER.warning(
+                "Unable to fetch stream URL for item %s", item_id, exc_info=True
+            )
+            return item_id, None
+        return item_id, {"stream_url": stream_url, "info": info}
 
     def update_device_list(self):
         """Update device list."""
-        autolog(">>>")
         if self._sessions is None:
             _LOGGER.error("Error updating Jellyfin devices.")
             return
 
         try:
             new_devices: list[JellyfinDevice] = []
-            active_devices: list[str] = []
-            dev_update = False
+            active_devices: set[str] = set()
+            # Callbacks are collected while scanning and fired once at the end
+            revived = False
+            updated: set[str] = set()
+            stale: set[str] = set()
             for session in self._sessions:
                 # Skip devices without custom names (e.g., web browsers with
                 # timestamp-based DeviceIds)
@@ -883,7 +1185,10 @@ class JellyfinClientManager:
                     )
                     continue
 
-                dev_key = f"{session.UserId}{device_name}"
+                dev_key = self._key_cache.get((session.UserId, device_name))
+                if dev_key is None:
+                    dev_key = sys.intern(f"{session.UserId}{device_name}")
+                    self._key_cache[(session.UserId, device_name)] = dev_key
 
                 if session.NowPlayingItem is not None:
                     _LOGGER.debug(
@@ -892,8 +1197,9 @@ class JellyfinClientManager:
                         session.NowPlayingItem.Type,
                     )
 
-                active_devices.append(dev_key)
-                if dev_key not in self._devices:
+                active_devices.add(dev_key)
+                device = self._devices.get(dev_key)
+                if device is None:
                     _LOGGER.debug(
                         "New Jellyfin DeviceID: %s. Adding to device list.", dev_key
                     )
@@ -903,34 +1209,36 @@ class JellyfinClientManager:
                 else:
                     # Before we send in new data check for changes to state
                     # to decide if we need to fire the update callback
-                    if not self._devices[dev_key].is_active:
+                    if not device.is_active:
                         # Device wasn't active on the last update
                         # We need to fire a device callback to let subs now
-                        dev_update = True
-
-                    do_update = self.update_check(self._devices[dev_key], session)
-                    self._devices[dev_key].update_session(session)
-                    self._devices[dev_key].set_active(True)
-                    if dev_update:
-                        self._do_new_devices_callback(0)
-                        dev_update = False
+                        revived = True
+
+                    do_update = self.update_check(device, session)
+                    device.update_session(session)
+                    device.set_active(True)
                     if do_update:
-                        self._do_update_callback(dev_key)
-
-            # Need to check for new inactive devices and flag
-            for dev_id in self._devices:
-                if dev_id not in active_devices:
-                    # Device no longer active
-                    if self._devices[dev_id].is_active:
-                        self._devices[dev_id].set_active(False)
-                        self._do_update_callback(dev_id)
-                        self._do_stale_devices_callback(dev_id)
-
-            # Call device callback if new devices were found.
-            if new_devices:
-                self._do_new_devices_callback(0)
+                        updated.add(dev_key)
+
+            # Devices missing from this push are no longer active. The set
+            # difference is a new set, so it is safe against later inserts.
+            for dev_id in self._devices.keys() - active_devices:
+                device = self._devices[dev_id]
+                if device.is_active:
+                    device.set_active(False)
+                    updated.add(dev_id)
+                    stale.add(dev_id)
+
+            # Hand every change from this scan to the loop in a single hop.
+            if new_devices or revived or updated or stale:
+                self._event_loop.call_soon(
+                    self._dispatch_device_changes,
+                    bool(new_devices or revived),
+                    updated,
+                    stale,
+                )
         except Exception:
-            _LOGGER.critical(traceback.format_exc())
+            _LOGGER.critical("Failed to update Jellyfin devices", exc_info=True)
             raise
 
     def update_check(self, existing: JellyfinDevice, new_session: SessionInfoDto) -> bool:
@@ -939,25 +1247,10 @@ class JellyfinClientManager:
         Returns True if either state is 'Playing', or on any state transition.
         Returns False if both states are: 'Paused', 'Idle', or 'Off'.
         """
-        autolog(">>>")
-
-        old_state = existing.state
-
-        # Determine new state from session
-        if new_session.NowPlayingItem is not None:
-            if new_session.PlayState is not None and new_session.PlayState.IsPaused:
-                new_state = STATE_PAUSED
-            else:
-                new_state = STATE_PLAYING
-        else:
-            new_state = STATE_IDLE
-
-        if old_state == STATE_PLAYING or new_state == STATE_PLAYING:
-            return True
-        elif old_state != new_state:
-            return True
-        else:
-            return False
+        new_state = _session_play_state(new_session)
+        # Playing -> anything is a transition, so only the new state needs
+        # checking for 'Playing'
+        return new_state != existing.state or new_state == STATE_PLAYING
 
     @property
     def info(self) -> SystemInfo | None:
@@ -1001,57 +1294,54 @@ class JellyfinClientManager:
         if not self.config.generate_upcoming or self.is_stopping:
             return None
 
-        payload: UpcomingCardPayload = [
-            UpcomingCardDefaults(
-                title_default="$title",
-                line1_default="$episode",
-                line2_default="$release",
-                line3_default="$rating - $runtime",
-                line4_default="$number - $studio",
-                icon="mdi:arrow-down-bold-circle",
-            )
-        ]
+        if self._data_cache is not None and self._data_cache[0] == self._data_version:
+            return self._data_cache[1]
+        payload = self._build_data()
+        self._data_cache = (self._data_version, payload)
+        return payload
+
+    def _build_data(self) -> UpcomingCardPayload:
+        """Build the Upcoming card attributes from the current NextUp items."""
+        payload: UpcomingCardPayload = [_UPCOMING_DEFAULTS]
 
         if self._data is None or not self._data.Items:
             return payload
 
+        append = payload.append
+        artwork_url = self.get_artwork_url
+        derive_common = self._derive_common
         for item in self._data.Items:
+            item_id = item.Id
             title = item.SeriesName or item.Name
             episode = item.Name
             if not title or not episode:
                 raise ValueError(
-                    f"Upcoming item missing required fields: Id={item.Id}, Title={title}, Episode={episode}"
+                    f"Upcoming item missing required fields: Id={item_id}, Title={title}, Episode={episode}"
                 )
 
-            studios = ",".join(o.Name for o in item.Studios or [] if o.Name) or None
-            genres = ",".join(item.Genres) if item.Genres else None
-            runtime_minutes = (
-                int(item.RunTimeTicks / 10000000 / 60) if item.RunTimeTicks else None
-            )
-            number = None
-            if item.ParentIndexNumber is not None and item.IndexNumber is not None:
-                number = f"S{item.ParentIndexNumber}E{item.IndexNumber}"
-
-            payload.append(
-                UpcomingCardItem(
-                    title=title,
-                    episode=episode,
-                    flag=False,
-                    airdate=item.DateCreated,
-                    number=number,
-                    runtime=runtime_minutes,
-                    studio=studios,
-                    release=dt.parse(item.PremiereDate).__format__("%d/%m/%Y")
+            number, studios, genres, runtime_minutes = derive_common(item)
+
+            card_item: UpcomingCardItem = {
+                "title": title,
+                "episode": episode,
+                "flag": False,
+                "airdate": item.DateCreated,
+                "number": number,
+                "runtime": runtime_minutes,
+                "studio": studios,
+                "release": (
+                    _format_date(item.PremiereDate, _FMT_DMY)
                     if item.PremiereDate
-                    else None,
-                    poster=self.get_artwork_url(item.Id),
-                    fanart=self.get_artwork_url(item.Id, "Backdrop"),
-                    genres=genres,
-                    rating=None,
-                    stream_url=None,
-                    info_url=None,
-                )
-            )
+                    else None
+                ),
+                "poster": artwork_url(item_id),
+                "fanart": artwork_url(item_id, "Backdrop"),
+                "genres": genres,
+                "rating": None,
+                "stream_url": None,
+                "info_url": None,
+            }
+            append(card_item)
 
         return payload
 
@@ -1061,23 +1351,52 @@ class JellyfinClientManager:
         if not self.config.generate_yamc or self.is_stopping:
             return None
 
-        payload: YamcCardPayload = [
-            YamcCardDefaults(
-                title_default="$title",
-                line1_default="$tagline",
-                line2_default="$empty",
-                line3_default="$release - $genres",
-                line4_default="$runtime - $rating - $info",
-                line5_default="$date",
-                text_link_default="$info_url",
-                link_default="$stream_url",
+        if self._yamc_cache is not None and self._yamc_cache[0] == self._yamc_version:
+            return self._yamc_cache[1]
+        result = self._build_yamc()
+        self._yamc_cache = (self._yamc_version, result)
+        return result
+
+    def _derive_common(self, item: BaseItemDto) -> _ItemSummary:
+        """Return the card fields shared by Upcoming and YAMC for an item."""
+        summary = self._derived_cache.get(item.Id)
+        if summary is None:
+            number = None
+            if item.ParentIndexNumber is not None and item.IndexNumber is not None:
+                number = f"S{item.ParentIndexNumber}E{item.IndexNumber}"
+            summary = _ItemSummary(
+                number=number,
+                studios=(
+                    ",".join([o.Name for o in item.Studios if o.Name]) or None
+                    if item.Studios
+                    else None
+                ),
+                genres=",".join(item.Genres) if item.Genres else None,
+                runtime=(
+                    item.RunTimeTicks // _TICKS_PER_MINUTE
+                    if item.RunTimeTicks
+                    else None
+                ),
             )
-        ]
+            self._derived_cache[item.Id] = summary
+        return summary
+
+    def _build_yamc(self):
+        """Build the YAMC card attributes from the current page."""
+        payload: YamcCardPayload = [_YAMC_DEFAULTS]
 
         if self._yamc is None or not self._yamc.Items:
             return payload
 
+        append = payload.append
+        artwork_url = self.get_artwork_url
+        streams = self._yamc_streams
+        derive_common = self._derive_common
+        type_fields = _YAMC_TYPE_HANDLERS.get
         for item in self._yamc.Items:
+            item_id = item.Id
+            item_type = item.Type
+            provider_ids = item.ProviderIds
             user_data = item.UserData
             base_flag = bool(user_data and user_data.Played)
             progress = 0.0
@@ -1092,147 +1411,95 @@ class JellyfinClientManager:
             elif item.CriticRating is not None:
                 rating = "\N{BLACK STAR} {}".format(round(item.CriticRating / 10, 1))
 
-            studios = ",".join(o.Name for o in item.Studios or [] if o.Name) or None
-            genres = ",".join(item.Genres) if item.Genres else None
-            stream_meta = self._yamc_streams.get(item.Id, {})
-            stream_url = stream_meta.get("stream_url")
-            stream_info = stream_meta.get("info")
-            number = None
-            if item.ParentIndexNumber is not None and item.IndexNumber is not None:
-                number = f"S{item.ParentIndexNumber}E{item.IndexNumber}"
+            number, studios, genres, runtime_minutes = derive_common(item)
+            stream_meta = streams.get(item_id)
+            stream_url = stream_meta["stream_url"] if stream_meta else None
+            stream_info = stream_meta["info"] if stream_meta else None
 
             info_url = None
-            if item.ProviderIds:
-                if item.Type == "Movie" and "Imdb" in item.ProviderIds:
-                    info_url = f"https://trakt.tv/search/imdb/{item.ProviderIds['Imdb']}?id_type=movie"
-                elif item.Type == "Series" and "Imdb" in item.ProviderIds:
-                    info_url = f"https://trakt.tv/search/imdb/{item.ProviderIds['Imdb']}?id_type=series"
-                elif item.Type == "Episode" and "Imdb" in item.ProviderIds:
-                    info_url = f"https://trakt.tv/search/imdb/{item.ProviderIds['Imdb']}?id_type=episode"
-                elif (
-                    item.Type == "MusicAlbum" and "MusicBrainzAlbum" in item.ProviderIds
-                ):
-                    info_url = f"https://musicbrainz.org/album/{item.ProviderIds['MusicBrainzAlbum']}"
-                elif (
-                    item.Type == "MusicArtist"
-                    and "MusicBrainzArtist" in item.ProviderIds
-                ):
-                    info_url = f"https://musicbrainz.org/artist/{item.ProviderIds['MusicBrainzArtist']}"
+            info_source = _INFO_URL.get(item_type)
+            if info_source is not None and provider_ids:
+                provider, template = info_source
+                provider_id = provider_ids.get(provider)
+                if provider_id is not None:
+                    info_url = template.format(provider_id)
 
             title = item.Name or item.SeriesName
             if not title:
-                raise ValueError(f"YAMC item missing title: Id={item.Id}")
-
-            episode_value: str | None = None
-            tagline_value: str | None = None
+                raise ValueError(f"YAMC item missing title: Id={item_id}")
+
+            (
+                episode_value,
+                tagline_value,
+                release_value,
+                fanart_type,
+                tracks_progress,
+            ) = type_fields(item_type, _yamc_default_fields)(item)
             flag_value = base_flag
-            release_value: str | None = None
-            fanart_type = "Primary"
-
-            if item.Type == "Movie":
-                episode_value = None
-                tagline_value = item.Taglines[0] if item.Taglines else ""
-                release_value = (
-                    dt.parse(item.PremiereDate).__format__("%Y")
-                    if item.PremiereDate
-                    else None
-                )
-                fanart_type = "Backdrop"
-            elif item.Type == "Series":
-                episode_value = item.Name
-                tagline_value = item.Name
-                release_value = (
-                    dt.parse(item.PremiereDate).__format__("%d/%m/%Y")
-                    if item.PremiereDate
-                    else None
-                )
-                fanart_type = "Backdrop"
-            elif item.Type == "Episode":
-                episode_value = item.Name
-                tagline_value = item.Name
-                release_value = (
-                    dt.parse(item.PremiereDate).__format__("%d/%m/%Y")
-                    if item.PremiereDate
-                    else None
-                )
-                fanart_type = "Primary"
-            elif item.Type == "MusicAlbum":
-                episode_value = None
-                tagline_value = ",".join(item.Artists) if item.Artists else None
-                release_value = (
-                    dt.parse(item.PremiereDate).__format__("%Y")
-                    if item.PremiereDate
-                    else None
-                )
-                flag_value = False
-                progress = 0.0
-            elif item.Type == "MusicArtist":
-                episode_value = None
-                tagline_value = ",".join(item.Artists) if item.Artists else None
-                release_value = (
-                    dt.parse(item.DateCreated).__format__("%Y")
-                    if item.DateCreated
-                    else None
-                )
-                flag_value = False
-                progress = 0.0
-            else:
-                episode_value = item.Name
-                tagline_value = item.Name
-                release_value = (
-                    dt.parse(item.PremiereDate).__format__("%d/%m/%Y")
-                    if item.PremiereDate
-                    else None
-                )
+            if not tracks_progress:
                 flag_value = False
                 progress = 0.0
 
-            payload.append(
-                YamcCardItem(
-                    id=item.Id,
-                    type=item.Type,
-                    title=title,
-                    episode=episode_value,
-                    tagline=tagline_value,
-                    flag=flag_value,
-                    airdate=item.DateCreated,
-                    number=number,
-                    runtime=int(item.RunTimeTicks / 10000000 / 60)
-                    if item.RunTimeTicks
-                    else None,
-                    studio=studios,
-                    release=release_value,
-                    poster=self.get_artwork_url(item.Id),
-                    fanart=self.get_artwork_url(item.Id, fanart_type),
-                    genres=genres,
-                    progress=progress,
-                    rating=rating,
-                    info=stream_info,
-                    stream_url=stream_url,
-                    info_url=info_url,
-                )
-            )
-
-        attrs = {}
-        attrs["last_search"] = self._last_search
-        attrs["last_playlist"] = self._last_playlist
-        attrs["playlists"] = json.dumps(PLAYLISTS)
-        attrs["total_items"] = min(50, self._yamc.TotalRecordCount)
-        attrs["page"] = self._yamc_cur_page
-        attrs["page_size"] = YAMC_PAGE_SIZE
-        attrs["data"] = json.dumps(payload)
+            card_item: YamcCardItem = {
+                "id": item_id,
+                "type": item_type,
+                "title": title,
+                "episode": episode_value,
+                "tagline": tagline_value,
+                "flag": flag_value,
+                "airdate": item.DateCreated,
+                "number": number,
+                "runtime": runtime_minutes,
+                "studio": studios,
+                "release": release_value,
+                "poster": artwork_url(item_id),
+                "fanart": artwork_url(item_id, fanart_type),
+                "genres": genres,
+                "progress": progress,
+                "rating": rating,
+                "info": stream_info,
+                "stream_url": stream_url,
+                "info_url": info_url,
+            }
+            append(card_item)
+
+        return {
+            "last_search": self._last_search,
+            "last_playlist": self._last_playlist,
+            "playlists": _PLAYLISTS_JSON,
+            "total_items": min(50, self._yamc.TotalRecordCount),
+            "page": self._yamc_cur_page,
+            "page_size": YAMC_PAGE_SIZE,
+            "data": json_dumps(payload),
+        }
 
-        return attrs
+    async def _async_command(
+        self,
+        method: str,
+        handler: str,
+        params: Mapping[str, str | int] | None = None,
+    ) -> None:
+        """Send a request whose response body is not needed to the server."""
+        try:
+            async with self._http.request(
+                method,
+                f"{self.get_server_url()}/{handler}",
+                params=params,
+                headers=self._auth_headers,
+                timeout=_COMMAND_TIMEOUT,
+                raise_for_status=True,
+            ):
+                pass
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise HomeAssistantError(
+                f"Jellyfin request {method} {handler} failed: {err!r}"
+            ) from err
 
     async def trigger_scan(self):
-        await self.hass.async_add_executor_job(
-            self._client.jellyfin._post, "Library/Refresh"
-        )
+        await self._async_command("POST", "Library/Refresh")
 
     async def delete_item(self, id: str) -> None:
-        await self.hass.async_add_executor_job(
-            self._client.jellyfin.items, f"/{id}", "DELETE"
-        )
+        await self._async_command("DELETE", f"Items/{id}")
         await self.update_data()
 
     async def search_item(self, search_term: str) -> None:
@@ -1271,19 +1538,16 @@ class JellyfinClientManager:
         # _LOGGER.debug("get_items: %s | %s", str(query), str(response))
         return response["Items"]
 
-    async def set_playstate(self, session_id: str, state: str, params: dict[str, object]) -> None:
-        await self.hass.async_add_executor_job(
-            self._client.jellyfin.post_session,
-            session_id,
-            "Playing/%s" % state,
-            params,
+    async def set_playstate(
+        self, session_id: str, state: str, params: Mapping[str, str | int]
+    ) -> None:
+        await self._async_command(
+            "POST", f"Sessions/{session_id}/Playing/{state}", params
         )
 
     async def play_media(self, session_id: str, media_id: str) -> None:
         params = {"playCommand": "PlayNow", "itemIds": media_id}
-        await self.hass.async_add_executor_job(
-            self._client.jellyfin.post_session, session_id, "Playing", params
-        )
+        await self._async_command("POST", f"Sessions/{session_id}/Playing", params)
 
     async def view_media(self, session_id: str, media_id: str) -> None:
         item = await self.hass.async_add_executor_job(
@@ -1296,9 +1560,7 @@ class JellyfinClientManager:
             "itemType": item["Type"],
             "itemName": item["Name"],
         }
-        await self.hass.async_add_executor_job(
-            self._client.jellyfin.post_session, session_id, "Viewing", params
-        )
+        await self._async_command("POST", f"Sessions/{session_id}/Viewing", params)
 
     async def get_artwork(
         self, media_id: str, artwork_type: str = "Primary"
@@ -1316,7 +1578,10 @@ class JellyfinClientManager:
         return (None, None)
 
     def get_artwork_url(self, media_id: str, artwork_type: str = "Primary") -> str:
-        return self._client.jellyfin.artwork(media_id, artwork_type, 500)
+        if not self._artwork_url:
+            # Not logged in yet; let the SDK build (or refuse to build) it
+            return self._client.jellyfin.artwork(media_id, artwork_type, 500)
+        return self._artwork_url.format(media_id, artwork_type)
 
     async def get_play_info(self, media_id: str, profile: object) -> object:
         return await self.hass.async_add_executor_job(
@@ -1326,74 +1591,7 @@ class JellyfinClientManager:
     async def get_stream_url(
         self, media_id: str, media_content_type: str
     ) -> tuple[str | None, str | None, str | None]:
-        profile = {
-            "Name": USER_APP_NAME,
-            "MaxStreamingBitrate": 25000 * 1000,
-            "MusicStreamingTranscodingBitrate": 1920000,
-            "TimelineOffsetSeconds": 5,
-            "TranscodingProfiles": [
-                {
-                    "Type": "Audio",
-                    "Container": "mp3",
-                    "Protocol": "http",
-                    "AudioCodec": "mp3",
-                    "MaxAudioChannels": "2",
-                },
-                {
-                    "Type": "Video",
-                    "Container": "mp4",
-                    "Protocol": "http",
-                    "AudioCodec": "aac,mp3,opus,flac,vorbis",
-                    "VideoCodec": "h264,mpeg4,mpeg2video",
-                    "MaxAudioChannels": "6",
-                },
-                {"Container": "jpeg", "Type": "Photo"},
-            ],
-            "DirectPlayProfiles": [
-                {"Type": "Audio", "Container": "mp3", "AudioCodec": "mp3"},
-                {"Type": "Audio", "Container": "m4a,m4b", "AudioCodec": "aac"},
-                {
-                    "Type": "Video",
-                    "Container": "mp4,m4v",
-                    "AudioCodec": "aac,mp3,opus,flac,vorbis",
-                    "VideoCodec": "h264,mpeg4,mpeg2video",
-                    "MaxAudioChannels": "6",
-                },
-            ],
-            "ResponseProfiles": [],
-            "ContainerProfiles": [],
-            "CodecProfiles": [],
-            "SubtitleProfiles": [
-                {"Format": "srt", "Method": "External"},
-                {"Format": "srt", "Method": "Embed"},
-                {"Format": "ass", "Method": "External"},
-                {"Format": "ass", "Method": "Embed"},
-                {"Format": "sub", "Method": "Embed"},
-                {"Format": "sub", "Method": "External"},
-                {"Format": "ssa", "Method": "Embed"},
-                {"Format": "ssa", "Method": "External"},
-                {"Format": "smi", "Method": "Embed"},
-                {"Format": "smi", "Method": "External"},
-                # Jellyfin currently refuses to serve these subtitle types as external.
-                {"Format": "pgssub", "Method": "Embed"},
-                # {
-                #    "Format": "pgssub",
-                #    "Method": "External"
-                # },
-                {"Format": "dvdsub", "Method": "Embed"},
-                # {
-                #    "Format": "dvdsub",
-                #    "Method": "External"
-                # },
-                {"Format": "pgs", "Method": "Embed"},
-                # {
-                #    "Format": "pgs",
-                #    "Method": "External"
-                # }
-            ],
-        }
-
-        raw_playback_info = await self.get_play_info(media_id, profile)
+        raw_playback_info = await self.get_play_info(media_id, _STREAM_PROFILE)
         _LOGGER.debug("playbackinfo: %s", str(raw_playback_info))
         if raw_playback_info is None:
             _LOGGER.error(f"No playback info for item id {media_id}")
@@ -1404,63 +1602,54 @@ class JellyfinClientManager:
             _LOGGER.error(f"No media sources for item id {media_id}")
             return (None, None, None)
 
-        selected: MediaSourceInfo | None = None
-        weight_selected = 0.0
-        for media_source in playback_info.MediaSources:
-            weight = (1 if media_source.SupportsDirectStream else 0) * 50000 + (
-                media_source.Bitrate or 0
-            ) / 1000
-            if weight > weight_selected:
-                weight_selected = weight
-                selected = media_source
-
-        if selected is None:
+        selected = max(playback_info.MediaSources, key=_source_weight)
+        if not any(_source_weight(selected)):
             return (None, None, None)
 
+        is_audio = media_content_type in _AUDIO_KINDS
+        server_url = self.get_server_url()
+        auth_token = self.get_auth_token()
         url = ""
         mimetype = "none/none"
         info = "Not playable"
         if selected.SupportsDirectStream:
             if selected.Container is None or selected.Id is None:
                 raise ValueError("DirectStream source missing Container or Id")
-            if media_content_type in ("Audio", "track"):
+            if is_audio:
                 mimetype = "audio/" + selected.Container
                 url = (
-                    self.get_server_url()
+                    server_url
                     + "/Audio/%s/stream?static=true&MediaSourceId=%s&api_key=%s"
-                    % (media_id, selected.Id, self.get_auth_token())
+                    % (media_id, selected.Id, auth_token)
                 )
             else:
                 mimetype = "video/" + selected.Container
                 url = (
-                    self.get_server_url()
+                    server_url
                     + "/Videos/%s/stream?static=true&MediaSourceId=%s&api_key=%s"
-                    % (media_id, selected.Id, self.get_auth_token())
+                    % (media_id, selected.Id, auth_token)
                 )
 
         elif selected.SupportsTranscoding:
             if selected.TranscodingUrl is None:
                 raise ValueError("Transcoding source missing TranscodingUrl")
-            url = self.get_server_url() + selected.TranscodingUrl
+            url = server_url + selected.TranscodingUrl
             container = selected.TranscodingContainer or selected.Container
             if container is None:
                 raise ValueError("Transcoding source missing Container")
-            if media_content_type in ("Audio", "track"):
+            if is_audio:
                 mimetype = "audio/" + container
             else:
                 mimetype = "video/" + container
 
         if selected.MediaStreams is not None:
-            if media_content_type in ("Audio", "track"):
-                for stream in selected.MediaStreams:
-                    if stream.Type == "Audio":
-                        info = f"{stream.Codec} {stream.SampleRate}Hz"
-                        break
-            else:
-                for stream in selected.MediaStreams:
-                    if stream.Type == "Video":
-                        info = f"{stream.Width}x{stream.Height} {stream.Codec}"
-                        break
+            want = "Audio" if is_audio else "Video"
+            stream = next((s for s in selected.MediaStreams if s.Type == want), None)
+            if stream is not None:
+                if is_audio:
+                    info = f"{stream.Codec} {stream.SampleRate}Hz"
+                else:
+                    info = f"{stream.Width}x{stream.Height} {stream.Codec}"
 
         _LOGGER.debug("stream info: %s - url: %s", info, url)
         return (url, mimetype, info)
@@ -1492,7 +1681,7 @@ class JellyfinClientManager:
         """Call registered callback functions."""
         for callback in self._new_devices_callbacks:
             _LOGGER.debug("Devices callback %s", callback)
-            self._event_loop.call_soon(callback, msg)
+            _run_device_callback(callback, msg)
 
     def add_stale_devices_callback(
         self, callback: collections.abc.Callable[[object], None]
@@ -1505,28 +1694,41 @@ class JellyfinClientManager:
         """Call registered callback functions."""
         for callback in self._stale_devices_callbacks:
             _LOGGER.debug("Stale Devices callback %s", callback)
-            self._event_loop.call_soon(callback, msg)
+            _run_device_callback(callback, msg)
 
     def add_update_callback(
         self, callback: collections.abc.Callable[[object], None], device: str
     ) -> None:
         """Register as callback for when a matching device changes."""
-        self._update_callbacks.append((callback, device))
+        self._update_callbacks[device].append(callback)
         _LOGGER.debug("Added update callback to %s on %s", callback, device)
 
     def remove_update_callback(
         self, callback: collections.abc.Callable[[object], None], device: str
     ) -> None:
         """Remove a registered update callback."""
-        if (callback, device) in self._update_callbacks:
-            self._update_callbacks.remove((callback, device))
+        callbacks = self._update_callbacks.get(device)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+            if not callbacks:
+                del self._update_callbacks[device]
             _LOGGER.debug("Removed update callback %s for %s", callback, device)
 
-    def _do_update_callback(self, msg: object) -> None:
+    def _do_update_callback(self, msg: str) -> None:
         """Call registered callback functions."""
-        for callback, device in self._update_callbacks:
-            if device == msg:
-                _LOGGER.debug(
-                    "Update callback %s for device %s by %s", callback, device, msg
-                )
-                self._event_loop.call_soon(callback, msg)
+        for callback in self._update_callbacks.get(msg, ()):
+            _LOGGER.debug("Update callback %s for device %s", callback, msg)
+            _run_device_callback(callback, msg)
+
+    @callback
+    def _dispatch_device_changes(
+        self, notify_new: bool, updated: set[str], stale: set[str]
+    ) -> None:
+        """Run the device callbacks collected by one device list scan."""
+        # Call device callback once if new or revived devices were found.
+        if notify_new:
+            self._do_new_devices_callback(0)
+        for dev_id in updated:
+            self._do_update_callback(dev_id)
+        for dev_id in stale:
+            self._do_stale_devices_callback(dev_id)
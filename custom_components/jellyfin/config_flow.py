@@ -1,11 +1,15 @@
 """Config flow for Jellyfin."""
 import asyncio
+import functools
 import logging
+import random
 from typing import Any
 
 import voluptuous as vol
 
 from jellyfin_apiclient_python import JellyfinClient
+from jellyfin_apiclient_python.exceptions import HTTPException
+from requests.exceptions import RequestException
 from homeassistant import config_entries, exceptions
 from homeassistant.config_entries import ConfigFlowResult
 from homeassistant.core import callback
@@ -35,6 +39,57 @@ RESULT_LOG_MESSAGE = {RESULT_CONN_ERROR: "Connection error"}
 ERROR_USER_REQUIRED = "user_required"
 ERROR_USER_FETCH = "user_fetch_failed"
 
+# Authentication runs blocking HTTP in the executor. A slot is held until the
+# executor job itself finishes, even if the flow stopped waiting for it, so at
+# most two workers are ever busy logging in. The timeout only bounds how long
+# a flow waits before reporting cannot_connect.
+_AUTH_SEMAPHORE = asyncio.Semaphore(2)
+_AUTH_TIMEOUT = 30.0
+
+# Login attempts within _AUTH_TIMEOUT, and the SDK HTTPException statuses that
+# mark a failure as transient (server waking up or briefly unreachable)
+_AUTH_ATTEMPTS = 3
+_TRANSIENT_STATUSES = frozenset({"ServerUnreachable", "ReadTimeout"})
+
+# Connection step form shared by the config and options flows. Current values
+# are layered on as suggested values instead of rebuilding it per render.
+USER_STEP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_URL): str,
+        vol.Required(CONF_API_KEY): str,
+        vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): bool,
+        vol.Optional(CONF_GENERATE_UPCOMING, default=False): bool,
+        vol.Optional(CONF_GENERATE_YAMC, default=False): bool,
+    }
+)
+
+# Shown on the user selection step when no users could be loaded
+EMPTY_SCHEMA = vol.Schema({})
+
+
+@functools.lru_cache(maxsize=8)
+def _user_select_schema(
+    default_value: str | None, options: tuple[tuple[str, str], ...]
+) -> vol.Schema:
+    """Build the user dropdown schema; options are hashable (label, value) pairs."""
+    select = selector(
+        {
+            "select": {
+                "options": [{"label": label, "value": value} for label, value in options],
+                "mode": "dropdown",
+            }
+        }
+    )
+    default = default_value if default_value is not None else vol.UNDEFINED
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_LIBRARY_USER_ID,
+                default=default,
+            ): select
+        }
+    )
+
 
 class UserSelectionError(exceptions.HomeAssistantError):
     """Raised when Jellyfin users cannot be loaded."""
@@ -46,8 +101,14 @@ class JellyfinFlowBase:
     def __init__(self):
         super().__init__()
         self._client: JellyfinClient | None = None
+        # Connection settings _client was authenticated with
+        self._client_key: tuple[str | None, str | None, bool] | None = None
         self._pending_entry_data: JellyfinEntryData | None = None
         self._library_user_id: str | None = None
+        # User dropdown options, reused across select_user re-renders until
+        # the connection settings change
+        self._user_options_cache: list[dict[str, str]] | None = None
+        self._user_options_key: tuple[str | None, str | None, bool] | None = None
 
     def _client_factory(self, verify_ssl: bool) -> JellyfinClient:
         client = JellyfinClient(allow_multiple_clients=True)
@@ -70,7 +131,12 @@ class JellyfinFlowBase:
                 discover=False,
             )
             info = client.jellyfin.get_system_info()
-        except Exception as exc:
+        except HTTPException as exc:
+            _LOGGER.debug("API key validation failed.", exc_info=True)
+            if exc.status in _TRANSIENT_STATUSES:
+                raise ServerUnreachable from exc
+            raise CannotConnect from exc
+        except (RequestException, KeyError, ValueError) as exc:
             _LOGGER.debug("API key validation failed.", exc_info=True)
             raise CannotConnect from exc
 
@@ -79,6 +145,44 @@ class JellyfinFlowBase:
 
         return client
 
+    async def _async_authenticate(self) -> JellyfinClient:
+        key = (self._url, self._api_key, self._verify_ssl)
+        if self._client is not None and self._client_key == key:
+            return self._client
+
+        # One executor job per attempt; the backoff sleeps on the event loop
+        # and every attempt shares the same timeout budget
+        async with asyncio.timeout(_AUTH_TIMEOUT):
+            for attempt in range(1, _AUTH_ATTEMPTS + 1):
+                try:
+                    client = await self._async_authenticate_job()
+                except ServerUnreachable:
+                    if attempt == _AUTH_ATTEMPTS:
+                        raise
+                    _LOGGER.debug("Jellyfin not reachable, retrying")
+                    await asyncio.sleep(random.uniform(2, 4) * attempt)
+                else:
+                    break
+        self._client_key = key
+        return client
+
+    async def _async_authenticate_job(self) -> JellyfinClient:
+        """Run one blocking login in the executor under an auth slot."""
+        await _AUTH_SEMAPHORE.acquire()
+        try:
+            future = self.hass.async_add_executor_job(
+                self._authenticate_client,
+                self._url,
+                self._api_key,
+                self._verify_ssl,
+            )
+        except BaseException:
+            _AUTH_SEMAPHORE.release()
+            raise
+        future.add_done_callback(_release_auth_slot)
+        # Shielded so a timeout abandons the wait, not the slot accounting
+        return await asyncio.shield(future)
+
     def _format_user_label(self, user: dict[str, Any]) -> str | None:
         user_id = user.get("Id")
         if not user_id:
@@ -92,48 +196,59 @@ class JellyfinFlowBase:
     def _fetch_user_options_from_client(self, client: JellyfinClient) -> list[dict[str, str]]:
         if client is None:
             raise UserSelectionError
+
         try:
             users = client.jellyfin.get_public_users()
             if not users:
                 users = client.jellyfin.get_users()
-        except Exception as exc:
+        except (HTTPException, RequestException, KeyError, ValueError) as exc:
             _LOGGER.debug("Failed to fetch Jellyfin users.", exc_info=True)
             raise UserSelectionError from exc
 
-        options: list[dict[str, str]] = []
-        for user in users or []:
-            label = self._format_user_label(user)
-            if not label:
-                continue
-            options.append({"label": label, "value": user["Id"]})
+        format_label = self._format_user_label
+        options = [
+            {"label": label, "value": user["Id"]}
+            for user in users or []
+            if (label := format_label(user))
+        ]
 
         if not options:
             raise UserSelectionError
         return options
 
     async def _async_get_user_options(self) -> list[dict[str, str]]:
-        return await self.hass.async_add_executor_job(
+        key = (self._url, self._api_key, self._verify_ssl)
+        if self._user_options_key == key and self._user_options_cache is not None:
+            return self._user_options_cache
+
+        options = await self.hass.async_add_executor_job(
             self._fetch_user_options_from_client,
             self._client,
         )
+        self._user_options_cache = options
+        self._user_options_key = key
+        return options
 
     def _build_user_schema(self, default_value: str | None, options: list[dict[str, str]]) -> vol.Schema:
-        select = selector(
-            {
-                "select": {
-                    "options": options,
-                    "mode": "dropdown",
-                }
-            }
+        return _user_select_schema(
+            default_value,
+            tuple((option["label"], option["value"]) for option in options),
         )
-        default = default_value if default_value is not None else vol.UNDEFINED
-        return vol.Schema(
-            {
-                vol.Required(
-                    CONF_LIBRARY_USER_ID,
-                    default=default,
-                ): select
-            }
+
+    def _show_user_form(self) -> ConfigFlowResult:
+        suggested_values = {
+            CONF_URL: self._url or "",
+            CONF_API_KEY: self._api_key or "",
+            CONF_VERIFY_SSL: self._verify_ssl,
+            CONF_GENERATE_UPCOMING: self._generate_upcoming,
+            CONF_GENERATE_YAMC: self._generate_yamc,
+        }
+        return self.async_show_form(  # type: ignore[return-value]
+            step_id="user",
+            data_schema=self.add_suggested_values_to_schema(
+                USER_STEP_SCHEMA, suggested_values
+            ),
+            errors=self._errors,
         )
 
     def _create_entry_from_pending(self, title: str) -> ConfigFlowResult:
@@ -189,12 +304,7 @@ class JellyfinFlowHandler(JellyfinFlowBase, config_entries.ConfigFlow):
                 await self.async_set_unique_id(DOMAIN)
                 self._abort_if_unique_id_configured()
 
-                self._client = await self.hass.async_add_executor_job(
-                    self._authenticate_client,
-                    self._url,
-                    self._api_key,
-                    self._verify_ssl,
-                )
+                self._client = await self._async_authenticate()
 
                 # Build pending entry data - validation deferred if needs_user
                 self._pending_entry_data = JellyfinEntryData.model_construct(
@@ -224,19 +334,7 @@ class JellyfinFlowHandler(JellyfinFlowBase, config_entries.ConfigFlow):
 
             self._errors["base"] = result
 
-        data_schema = {
-            vol.Required(CONF_URL, default=self._url or ""): str,
-            vol.Required(CONF_API_KEY, default=self._api_key or ""): str,
-            vol.Optional(CONF_VERIFY_SSL, default=self._verify_ssl): bool,
-            vol.Optional(CONF_GENERATE_UPCOMING, default=self._generate_upcoming): bool,
-            vol.Optional(CONF_GENERATE_YAMC, default=self._generate_yamc): bool,
-        }
-
-        return self.async_show_form(
-            step_id="user",
-            data_schema=vol.Schema(data_schema),
-            errors=self._errors,
-        )
+        return self._show_user_form()
 
     async def async_step_select_user(self, user_input: dict[str, object] | None = None) -> ConfigFlowResult:
         """Select the Jellyfin user for optional features."""
@@ -250,14 +348,13 @@ class JellyfinFlowHandler(JellyfinFlowBase, config_entries.ConfigFlow):
                 raise ValueError("No pending entry data")
             else:
                 library_user_id = str(raw_library_user_id)
-                # Rebuild with user and validate
-                self._pending_entry_data = JellyfinEntryData(
-                    url=self._pending_entry_data.url,
-                    api_key=self._pending_entry_data.api_key,
-                    verify_ssl=self._pending_entry_data.verify_ssl,
-                    generate_upcoming=self._pending_entry_data.generate_upcoming,
-                    generate_yamc=self._pending_entry_data.generate_yamc,
-                    library_user_id=library_user_id,
+                # Pending data was built with model_construct, so validate
+                # every field once now that the user is known
+                self._pending_entry_data = JellyfinEntryData.model_validate(
+                    {
+                        **self._pending_entry_data.model_dump(),
+                        CONF_LIBRARY_USER_ID: library_user_id,
+                    }
                 )
                 self._library_user_id = library_user_id
                 return self._create_entry_from_pending(self._url)
@@ -271,7 +368,7 @@ class JellyfinFlowHandler(JellyfinFlowBase, config_entries.ConfigFlow):
         if not user_options:
             return self.async_show_form(
                 step_id="select_user",
-                data_schema=vol.Schema({}),
+                data_schema=EMPTY_SCHEMA,
                 errors=self._errors,
             )
 
@@ -321,12 +418,7 @@ class JellyfinOptionsFlowHandler(JellyfinFlowBase, config_entries.OptionsFlow):
                     library_user_id=self._library_user_id,
                 )
                 try:
-                    self._client = await self.hass.async_add_executor_job(
-                        self._authenticate_client,
-                        self._url,
-                        self._api_key,
-                        self._verify_ssl,
-                    )
+                    self._client = await self._async_authenticate()
                 except (asyncio.TimeoutError, CannotConnect):
                     _LOGGER.error("cannot connect")
                     result = RESULT_CONN_ERROR
@@ -345,19 +437,7 @@ class JellyfinOptionsFlowHandler(JellyfinFlowBase, config_entries.OptionsFlow):
                 )
                 return self._create_entry_from_pending(self._url)
 
-        data_schema = {
-            vol.Required(CONF_URL, default=self._url or ""): str,
-            vol.Required(CONF_API_KEY, default=self._api_key): str,
-            vol.Optional(CONF_VERIFY_SSL, default=self._verify_ssl): bool,
-            vol.Optional(CONF_GENERATE_UPCOMING, default=self._generate_upcoming): bool,
-            vol.Optional(CONF_GENERATE_YAMC, default=self._generate_yamc): bool,
-        }
-
-        return self.async_show_form(
-            step_id="user",
-            data_schema=vol.Schema(data_schema),
-            errors=self._errors,
-        )
+        return self._show_user_form()
 
     async def async_step_select_user(self, user_input: dict[str, object] | None = None) -> ConfigFlowResult:
         self._errors = {}
@@ -370,14 +450,13 @@ class JellyfinOptionsFlowHandler(JellyfinFlowBase, config_entries.OptionsFlow):
                 raise ValueError("No pending entry data")
             else:
                 library_user_id = str(raw_library_user_id)
-                # Rebuild with user and validate
-                self._pending_entry_data = JellyfinEntryData(
-                    url=self._pending_entry_data.url,
-                    api_key=self._pending_entry_data.api_key,
-                    verify_ssl=self._pending_entry_data.verify_ssl,
-                    generate_upcoming=self._pending_entry_data.generate_upcoming,
-                    generate_yamc=self._pending_entry_data.generate_yamc,
-                    library_user_id=library_user_id,
+                # Pending data was built with model_construct, so validate
+                # every field once now that the user is known
+                self._pending_entry_data = JellyfinEntryData.model_validate(
+                    {
+                        **self._pending_entry_data.model_dump(),
+                        CONF_LIBRARY_USER_ID: library_user_id,
+                    }
                 )
                 self._library_user_id = library_user_id
                 return self._create_entry_from_pending(self._url)
@@ -391,7 +470,7 @@ class JellyfinOptionsFlowHandler(JellyfinFlowBase, config_entries.OptionsFlow):
         if not user_options:
             return self.async_show_form(
                 step_id="select_user",
-                data_schema=vol.Schema({}),
+                data_schema=EMPTY_SCHEMA,
                 errors=self._errors,
             )
 
@@ -402,5 +481,16 @@ class JellyfinOptionsFlowHandler(JellyfinFlowBase, config_entries.OptionsFlow):
         )
 
 
+def _release_auth_slot(future: asyncio.Future[Any]) -> None:
+    _AUTH_SEMAPHORE.release()
+    if not future.cancelled():
+        # Mark the result as retrieved when nobody is awaiting it anymore
+        future.exception()
+
+
 class CannotConnect(exceptions.HomeAssistantError):
     """Error to indicate we can not connect."""
+
+
+class ServerUnreachable(CannotConnect):
+    """Error to indicate the server did not respond, which may be transient."""
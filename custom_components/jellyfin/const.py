@@ -3,6 +3,7 @@ from typing import TypedDict
 
 DOMAIN = "jellyfin"
 SIGNAL_STATE_UPDATED = "{}.updated".format(DOMAIN)
+SIGNAL_DATA_UPDATED = "{}.data_updated".format(DOMAIN)
 
 SERVICE_SCAN = "trigger_scan"
 SERVICE_YAMC_SETPAGE = "yamc_setpage"
@@ -74,3 +75,5 @@ PLAYLISTS: list[PlaylistDef] = [
         }
     },
 ]
+
+PLAYLISTS_BY_NAME: dict[str, PlaylistDef] = {pl["name"]: pl for pl in PLAYLISTS}
@@ -130,10 +130,14 @@ class JellyfinMediaPlayer(MediaPlayerEntity):
 
     async def async_added_to_hass(self) -> None:
         self.hass.data[DOMAIN][self.jelly_cm.host][PLATFORM]["entities"].append(self)
+        self.hass.data[DOMAIN][self.jelly_cm.host]["entities_by_id"][self.entity_id] = self
         self.jelly_cm.add_update_callback(self.async_update_callback, self.device_id)
 
     async def async_will_remove_from_hass(self) -> None:
         self.hass.data[DOMAIN][self.jelly_cm.host][PLATFORM]["entities"].remove(self)
+        self.hass.data[DOMAIN][self.jelly_cm.host]["entities_by_id"].pop(
+            self.entity_id, None
+        )
         self.jelly_cm.remove_update_callback(self.async_update_callback, self.device_id)
 
     @callback
@@ -300,7 +304,7 @@ class JellyfinMediaPlayer(MediaPlayerEntity):
         return self.device.media_album_name
 
     @property
-    def media_artist(self) -> str | list[str] | None:
+    def media_artist(self) -> str | None:
         """Return the artist of current playing media (Music track only)."""
         return self.device.media_artist
 
@@ -86,7 +86,7 @@ class SystemInfo(BaseModel):
 class PlayerStateInfo(BaseModel):
     """Playback state for a session."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     # Non-nullable per spec
     IsPaused: bool
@@ -107,7 +107,7 @@ class PlayerStateInfo(BaseModel):
 class ImageTags(BaseModel):
     """Image tag identifiers keyed by image type."""
 
-    model_config = ConfigDict(extra="allow")  # Unknown image types OK
+    model_config = ConfigDict(extra="allow", frozen=True)  # Unknown image types OK
 
     Primary: str | None = None
     Thumb: str | None = None
@@ -119,7 +119,7 @@ class ImageTags(BaseModel):
 class NowPlayingItemDto(BaseModel):
     """Media item currently playing in a session."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     # Non-nullable per spec
     Id: str
@@ -140,7 +140,7 @@ class NowPlayingItemDto(BaseModel):
 class SessionInfoDto(BaseModel):
     """Active session information from Jellyfin server."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     # Non-nullable per spec
     UserId: str
@@ -12,6 +12,7 @@ from homeassistant.const import (
     STATE_ON,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity
 
 from . import JellyfinClientManager, autolog
@@ -57,10 +58,19 @@ class JellyfinSensor(Entity):
     async def async_added_to_hass(self) -> None:
         autolog("<<<")
         self.hass.data[DOMAIN][self.jelly_cm.host][PLATFORM]["entities"].append(self)
+        self.hass.data[DOMAIN][self.jelly_cm.host]["entities_by_id"][self.entity_id] = self
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self.jelly_cm.data_updated_signal, self.async_write_ha_state
+            )
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         autolog("<<<")
         self.hass.data[DOMAIN][self.jelly_cm.host][PLATFORM]["entities"].remove(self)
+        self.hass.data[DOMAIN][self.jelly_cm.host]["entities_by_id"].pop(
+            self.entity_id, None
+        )
 
     @property
     def available(self) -> bool:
@@ -176,6 +186,14 @@ class JellyfinItemCountSensor(SensorEntity):
         self._item_type = item_type
         self._count_getter = count_getter
 
+    async def async_added_to_hass(self) -> None:
+        """Write state whenever the manager refreshes its library data."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self.jelly_cm.data_updated_signal, self.async_write_ha_state
+            )
+        )
+
     @property
     def unique_id(self) -> str | None:
         """Return unique ID for this sensor."""
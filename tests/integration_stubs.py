@@ -0,0 +1,137 @@
+"""Stub Home Assistant and third-party modules so the integration package imports.
+
+Only the names the integration touches at import time need to exist; anything
+else resolves lazily to a permissive placeholder. Modules another test module
+already stubbed are extended in place rather than replaced.
+"""
+import importlib.util
+import json
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKAGE = "custom_components.jellyfin"
+
+
+class _StubMeta(type):
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return MagicMock(name=f"{cls.__name__}.{name}")
+
+
+class _Stub(metaclass=_StubMeta):
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return MagicMock(name=f"{type(self).__name__}.{name}")
+
+
+class _StubModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if name.isupper():
+            value = name.lower()
+        elif name[0].isupper():
+            base = Exception if name.endswith("Error") else _Stub
+            value = _StubMeta(name, (base,), {})
+        else:
+            value = MagicMock(name=f"{self.__name__}.{name}")
+        setattr(self, name, value)
+        return value
+
+
+def _module(name, **attrs):
+    module = sys.modules.get(name)
+    if module is None:
+        module = sys.modules[name] = _StubModule(name)
+    elif type(module) is types.ModuleType:
+        module.__class__ = _StubModule
+    for attr, value in attrs.items():
+        if attr not in vars(module):
+            setattr(module, attr, value)
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(_module(parent), child, module)
+    return module
+
+
+class HomeAssistantError(Exception):
+    pass
+
+
+class ConfigEntryNotReady(HomeAssistantError):
+    pass
+
+
+class ClientError(Exception):
+    pass
+
+
+def _install_stubs():
+    _module("aiohttp", ClientError=ClientError)
+    _module("aiohttp.hdrs", AUTHORIZATION="Authorization")
+    _module("aiohttp.typedefs")
+    _module("dateutil.parser", parse=MagicMock(name="parse"))
+    _module("voluptuous")
+    _module("jellyfin_apiclient_python")
+    _module("homeassistant.core", callback=lambda func: func)
+    _module(
+        "homeassistant.exceptions",
+        HomeAssistantError=HomeAssistantError,
+        ConfigEntryNotReady=ConfigEntryNotReady,
+    )
+    _module("homeassistant.config_entries")
+    _module("homeassistant.const", CONF_URL="url", DEVICE_DEFAULT_NAME="Unnamed Device")
+    for name in (
+        "homeassistant.helpers.config_validation",
+        "homeassistant.helpers.aiohttp_client",
+        "homeassistant.helpers.debounce",
+        "homeassistant.helpers.device_registry",
+        "homeassistant.helpers.dispatcher",
+        "homeassistant.helpers.entity_platform",
+        "homeassistant.util.async_",
+        "homeassistant.util.dt",
+        "homeassistant.components.http",
+        "homeassistant.components.media_player.const",
+        "homeassistant.components.media_source.const",
+        "homeassistant.components.media_source.models",
+    ):
+        _module(name)
+    _module("homeassistant.helpers.json", json_dumps=json.dumps)
+
+
+def load_integration():
+    """Return the integration package, executing its real __init__.
+
+    The stub modules added here are dropped from sys.modules again once the
+    integration modules hold their references, so test modules that install
+    their own fakes with sys.modules.setdefault still get them.
+    """
+    package = sys.modules.get(PACKAGE)
+    if package is not None and hasattr(package, "JellyfinClientManager"):
+        return package
+
+    existing = set(sys.modules)
+    _install_stubs()
+    _module("custom_components").__path__ = [str(ROOT / "custom_components")]
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE,
+        ROOT / "custom_components" / "jellyfin" / "__init__.py",
+        submodule_search_locations=[str(ROOT / "custom_components" / "jellyfin")],
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE] = package
+    spec.loader.exec_module(package)
+    importlib.import_module(f"{PACKAGE}.media_player")
+
+    for name in set(sys.modules) - existing:
+        if isinstance(sys.modules[name], _StubModule) and name != "custom_components":
+            del sys.modules[name]
+    return package
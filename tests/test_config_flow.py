@@ -45,9 +45,27 @@ class _FakeJellyfinClient:
         return None
 
 
+class _FakeHTTPException(Exception):
+    def __init__(self, status, message=None):
+        super().__init__(status, message)
+        self.status = status
+        self.message = message
+
+
 _jf_module = types.ModuleType("jellyfin_apiclient_python")
 _jf_module.JellyfinClient = _FakeJellyfinClient
+_jf_exceptions_module = types.ModuleType("jellyfin_apiclient_python.exceptions")
+_jf_exceptions_module.HTTPException = _FakeHTTPException
+_jf_module.exceptions = _jf_exceptions_module
 sys.modules.setdefault("jellyfin_apiclient_python", _jf_module)
+sys.modules.setdefault("jellyfin_apiclient_python.exceptions", _jf_exceptions_module)
+
+_requests_module = types.ModuleType("requests")
+_requests_exceptions_module = types.ModuleType("requests.exceptions")
+_requests_exceptions_module.RequestException = type("RequestException", (OSError,), {})
+_requests_module.exceptions = _requests_exceptions_module
+sys.modules.setdefault("requests", _requests_module)
+sys.modules.setdefault("requests.exceptions", _requests_exceptions_module)
 
 ha_module = types.ModuleType("homeassistant")
 
@@ -73,6 +91,11 @@ class _BaseFlow:
     def async_abort(self, reason):
         return {"type": "abort", "reason": reason}
 
+    def add_suggested_values_to_schema(self, data_schema, suggested_values):
+        schema = _FakeSchema(data_schema)
+        schema.suggested_values = dict(suggested_values)
+        return schema
+
 
 class _ConfigFlow(_BaseFlow):
     pass
@@ -91,6 +114,8 @@ class _HandlerRegistry:
 
 
 config_entries_module.ConfigFlow = _ConfigFlow
+config_entries_module.ConfigFlowResult = dict
+config_entries_module.ConfigEntry = object
 config_entries_module.OptionsFlow = _OptionsFlow
 config_entries_module.CONN_CLASS_LOCAL_PUSH = "local_push"
 config_entries_module.HANDLERS = _HandlerRegistry()
@@ -149,6 +174,7 @@ sys.modules.setdefault("custom_components.jellyfin", jellyfin_pkg)
 
 sys.path.append(str(ROOT))
 
+from custom_components.jellyfin import config_flow  # noqa: E402
 from custom_components.jellyfin.config_flow import JellyfinFlowBase, JellyfinFlowHandler  # noqa: E402
 from custom_components.jellyfin.const import (  # noqa: E402
     CONF_API_KEY,
@@ -163,8 +189,13 @@ def _build_flow() -> JellyfinFlowHandler:
     flow = JellyfinFlowHandler()
     hass = MagicMock()
 
-    async def async_add_executor_job(func, *args):
-        return func(*args)
+    def async_add_executor_job(func, *args):
+        future = asyncio.get_running_loop().create_future()
+        try:
+            future.set_result(func(*args))
+        except Exception as exc:  # pylint: disable=broad-except
+            future.set_exception(exc)
+        return future
 
     hass.async_add_executor_job = async_add_executor_job
     loop = asyncio.new_event_loop()
@@ -231,3 +262,166 @@ def test_flow_with_optional_features_requires_user_selection():
     assert result2["data"][CONF_LIBRARY_USER_ID] == "abc"
     assert result2["data"][CONF_GENERATE_UPCOMING] is True
     assert result2["data"][CONF_GENERATE_YAMC] is True
+
+
+def test_auth_slot_held_until_executor_job_finishes():
+    flow = _build_flow()
+    flow._url = "http://server"
+    flow._api_key = "token"
+    pending = {}
+
+    def async_add_executor_job(func, *args):
+        pending["future"] = asyncio.get_running_loop().create_future()
+        return pending["future"]
+
+    flow.hass.async_add_executor_job = async_add_executor_job
+
+    async def _run():
+        free_slots = config_flow._AUTH_SEMAPHORE._value
+        with patch.object(config_flow, "_AUTH_TIMEOUT", 0.01):
+            try:
+                await flow._async_authenticate()
+            except TimeoutError:
+                pass
+            else:
+                raise AssertionError("expected a timeout")
+        # The abandoned login still occupies its worker, so it keeps the slot
+        assert config_flow._AUTH_SEMAPHORE._value == free_slots - 1
+        pending["future"].set_result(MagicMock())
+        await asyncio.sleep(0)
+        assert config_flow._AUTH_SEMAPHORE._value == free_slots
+
+    asyncio.run(_run())
+
+
+def _connection_input(**overrides):
+    user_input = {
+        CONF_URL: "http://server",
+        CONF_API_KEY: "token",
+        CONF_VERIFY_SSL: True,
+        CONF_GENERATE_UPCOMING: False,
+        CONF_GENERATE_YAMC: False,
+    }
+    user_input.update(overrides)
+    return user_input
+
+
+def test_transient_auth_failure_is_retried():
+    flow = _build_flow()
+
+    async def _run():
+        with patch.object(
+            JellyfinFlowBase,
+            "_authenticate_client",
+            side_effect=[config_flow.ServerUnreachable(), MagicMock()],
+        ) as authenticate, patch.object(config_flow.random, "uniform", return_value=0):
+            result = await flow.async_step_user(user_input=_connection_input())
+        return result, authenticate.call_count
+
+    result, attempts = asyncio.run(_run())
+
+    assert result["type"] == "create_entry"
+    assert attempts == 2
+
+
+def test_auth_gives_up_after_all_attempts_fail():
+    flow = _build_flow()
+
+    async def _run():
+        with patch.object(
+            JellyfinFlowBase,
+            "_authenticate_client",
+            side_effect=config_flow.ServerUnreachable(),
+        ) as authenticate, patch.object(config_flow.random, "uniform", return_value=0):
+            result = await flow.async_step_user(user_input=_connection_input())
+        return result, authenticate.call_count
+
+    result, attempts = asyncio.run(_run())
+
+    assert result["type"] == "form"
+    assert result["errors"] == {"base": "cannot_connect"}
+    assert attempts == config_flow._AUTH_ATTEMPTS
+
+
+def test_authenticate_client_flags_only_transient_errors():
+    flow = JellyfinFlowBase()
+
+    def _client_raising(status):
+        client = _FakeJellyfinClient()
+        client.jellyfin.get_system_info = MagicMock(side_effect=_FakeHTTPException(status))
+        return client
+
+    for status, expected in (
+        ("ServerUnreachable", config_flow.ServerUnreachable),
+        ("Unauthorized", config_flow.CannotConnect),
+    ):
+        with patch.object(JellyfinFlowBase, "_client_factory", return_value=_client_raising(status)):
+            try:
+                flow._authenticate_client("http://server", "token", True)
+            except config_flow.CannotConnect as exc:
+                assert type(exc) is expected
+            else:
+                raise AssertionError("expected CannotConnect")
+
+
+def test_user_options_cached_until_connection_settings_change():
+    flow = _build_flow()
+    flow._url = "http://server"
+    flow._api_key = "token"
+    flow._client = MagicMock()
+    options = [{"label": "User A", "value": "abc"}]
+
+    async def _run():
+        with patch.object(
+            JellyfinFlowBase, "_fetch_user_options_from_client", return_value=options
+        ) as fetch:
+            assert await flow._async_get_user_options() == options
+            assert await flow._async_get_user_options() == options
+            assert fetch.call_count == 1
+
+            flow._api_key = "other-token"
+            assert await flow._async_get_user_options() == options
+            assert fetch.call_count == 2
+
+    asyncio.run(_run())
+
+
+def test_authenticated_client_reused_for_unchanged_settings():
+    flow = _build_flow()
+    flow._url = "http://server"
+    flow._api_key = "token"
+    client = MagicMock()
+
+    async def _run():
+        with patch.object(
+            JellyfinFlowBase, "_authenticate_client", return_value=client
+        ) as authenticate:
+            flow._client = await flow._async_authenticate()
+            assert await flow._async_authenticate() is client
+            assert authenticate.call_count == 1
+
+            flow._verify_ssl = not flow._verify_ssl
+            await flow._async_authenticate()
+            assert authenticate.call_count == 2
+
+    asyncio.run(_run())
+
+
+def test_user_form_keeps_submitted_values_after_error():
+    flow = _build_flow()
+    user_input = _connection_input(
+        **{CONF_URL: "http://other", CONF_VERIFY_SSL: False, CONF_GENERATE_YAMC: True}
+    )
+
+    async def _run():
+        with patch.object(
+            JellyfinFlowBase, "_authenticate_client", side_effect=config_flow.CannotConnect
+        ):
+            return await flow.async_step_user(user_input=user_input)
+
+    result = asyncio.run(_run())
+
+    assert result["type"] == "form"
+    assert result["step_id"] == "user"
+    assert result["errors"] == {"base": "cannot_connect"}
+    assert result["data_schema"].suggested_values == user_input
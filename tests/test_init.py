@@ -0,0 +1,360 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from integration_stubs import load_integration
+
+jellyfin = load_integration()
+
+
+class _FakeRequest:
+    def __init__(self, error=None):
+        self._error = error
+
+    async def __aenter__(self):
+        if self._error is not None:
+            raise self._error
+        return MagicMock()
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def _build_manager(error=None):
+    manager = object.__new__(jellyfin.JellyfinClientManager)
+    manager.jf_client = MagicMock()
+    manager.jf_client.config.data = {"auth.server": "http://server"}
+    manager._auth_headers = {"Authorization": 'MediaBrowser Token="token"'}
+    manager._http = MagicMock()
+    manager._http.request = MagicMock(return_value=_FakeRequest(error))
+    return manager
+
+
+async def _run_inline(func, *args):
+    return func(*args)
+
+
+def _build_live_manager(**options):
+    hass = MagicMock()
+    hass.loop = asyncio.get_running_loop()
+    hass.async_add_executor_job = _run_inline
+    config = jellyfin.JellyfinEntryData(url="http://server", api_key="key", **options)
+    manager = jellyfin.JellyfinClientManager(hass, config)
+    manager.jf_client = MagicMock()
+    manager.jf_client.config.data = {"auth.server": "http://server", "auth.token": "token"}
+    manager.update_device_list = MagicMock()
+    return manager
+
+
+def _session(device_name):
+    return {
+        "UserId": "user",
+        "LastActivityDate": "2024-01-01T00:00:00Z",
+        "LastPlaybackCheckIn": "2024-01-01T00:00:00Z",
+        "IsActive": True,
+        "SupportsMediaControl": True,
+        "SupportsRemoteControl": True,
+        "HasCustomDeviceName": True,
+        "DeviceName": device_name,
+    }
+
+
+def test_command_posts_to_server():
+    manager = _build_manager()
+
+    asyncio.run(manager.trigger_scan())
+
+    args, kwargs = manager._http.request.call_args
+    assert args == ("POST", "http://server/Library/Refresh")
+    assert kwargs["headers"] == manager._auth_headers
+
+
+def test_command_failures_raise_home_assistant_error():
+    for error in (jellyfin.aiohttp.ClientError("boom"), TimeoutError()):
+        manager = _build_manager(error)
+        try:
+            asyncio.run(manager.trigger_scan())
+        except jellyfin.HomeAssistantError as exc:
+            assert exc.__cause__ is error
+        else:
+            raise AssertionError("expected HomeAssistantError")
+
+
+def test_sessions_pushes_coalesce_into_one_flush():
+    async def run():
+        manager = _build_live_manager()
+        manager._event_loop = MagicMock(wraps=manager._event_loop)
+        with patch.object(jellyfin, "_SESSIONS_COALESCE_DELAY", 0.01):
+            for name in ("Kitchen", "Den", "Living Room"):
+                manager._queue_sessions([_session(name)])
+            await asyncio.sleep(0.05)
+
+        assert manager._event_loop.call_later.call_count == 1
+        manager.update_device_list.assert_called_once_with()
+        assert [s.DeviceName for s in manager._sessions] == ["Living Room"]
+        assert manager._sessions_handle is None
+
+    asyncio.run(run())
+
+
+def test_stop_cancels_pending_sessions_flush():
+    async def run():
+        manager = _build_live_manager()
+        with patch.object(jellyfin, "_SESSIONS_COALESCE_DELAY", 0.01):
+            manager._queue_sessions([_session("Kitchen")])
+            await manager.stop()
+            await asyncio.sleep(0.05)
+
+        assert manager._sessions_handle is None
+        manager.update_device_list.assert_not_called()
+        assert manager._sessions is None
+
+    asyncio.run(run())
+
+
+def test_repeated_disconnects_start_one_reconnect():
+    async def run():
+        manager = _build_live_manager()
+        manager.is_stopping = False
+        manager.login = MagicMock(return_value=True)
+        with patch.object(jellyfin, "_RECONNECT_BACKOFF", (0.01,)):
+            manager._handle_event("WebSocketDisconnect", None)
+            reconnect = manager._reconnect_future
+            manager._handle_event("WebSocketDisconnect", None)
+            assert manager._reconnect_future is reconnect
+            await asyncio.wrap_future(reconnect)
+
+        manager.login.assert_called_once_with()
+        manager.jf_client.start.assert_called_once_with(True)
+
+    asyncio.run(run())
+
+
+def test_stop_during_reconnect_backoff_does_not_start_client():
+    async def run():
+        manager = _build_live_manager()
+        manager.is_stopping = False
+        manager.login = MagicMock(return_value=True)
+        with patch.object(jellyfin, "_RECONNECT_BACKOFF", (0.05,)):
+            manager._handle_event("WebSocketDisconnect", None)
+            await asyncio.sleep(0.01)
+            await manager.stop()
+            await asyncio.sleep(0.1)
+
+        assert manager._reconnect_future is None
+        manager.login.assert_not_called()
+        manager.jf_client.start.assert_not_called()
+
+    asyncio.run(run())
+
+
+def test_stop_during_reconnect_login_does_not_start_client():
+    async def run():
+        manager = _build_live_manager()
+        manager.is_stopping = False
+        manager.login = MagicMock()
+        login_started = asyncio.Event()
+        login_result = asyncio.get_running_loop().create_future()
+
+        def executor_job(func, *args):
+            if func is manager.login:
+                login_started.set()
+                return login_result
+            return _run_inline(func, *args)
+
+        manager.hass.async_add_executor_job = executor_job
+        with patch.object(jellyfin, "_RECONNECT_BACKOFF", (0,)):
+            reconnect = asyncio.create_task(manager._async_reconnect())
+            await login_started.wait()
+            await manager.stop()
+            login_result.set_result(True)
+            await reconnect
+
+        manager.jf_client.start.assert_not_called()
+
+    asyncio.run(run())
+
+
+def test_unchanged_sessions_push_skips_device_update():
+    async def run():
+        manager = _build_live_manager()
+        with patch.object(jellyfin, "_SESSIONS_COALESCE_DELAY", 0):
+            for name in ("Kitchen", "Kitchen", "Den"):
+                manager._queue_sessions([_session(name)])
+                await asyncio.sleep(0.01)
+
+        assert manager.update_device_list.call_count == 2
+        assert [s.DeviceName for s in manager._sessions] == ["Den"]
+
+    asyncio.run(run())
+
+
+def _query_result(*names):
+    items = [{"Id": name.lower(), "Type": "Series", "Name": name} for name in names]
+    return {"Items": items, "TotalRecordCount": len(items)}
+
+
+def test_card_payloads_follow_replaced_items():
+    async def run():
+        manager = _build_live_manager(
+            generate_upcoming=True, generate_yamc=True, library_user_id="user"
+        )
+        manager.is_stopping = False
+        manager._artwork_url = "http://server/Items/{}/Images/{}"
+        api = manager.jf_client.jellyfin
+        api.shows.return_value = _query_result("Andor")
+        api.items.return_value = _query_result("Severance")
+
+        await manager.update_data()
+        assert manager.data[1]["title"] == "Andor"
+        assert "Severance" in manager.yamc["data"]
+
+        api.shows.return_value = _query_result("Shogun")
+        api.items.return_value = _query_result("Silo")
+        await manager.update_data()
+        assert manager.data[1]["title"] == "Shogun"
+        assert "Silo" in manager.yamc["data"]
+
+        api.items.return_value = _query_result("Dark")
+        await manager.yamc_set_page(2)
+        assert "Dark" in manager.yamc["data"]
+        assert manager.yamc["page"] == 2
+
+        api.shows.return_value = _query_result("Fargo")
+        await manager.yamc_set_playlist("nextup")
+        assert "Fargo" in manager.yamc["data"]
+        assert manager.yamc["last_playlist"] == "nextup"
+
+    asyncio.run(run())
+
+
+def test_refresh_signals_sensors_after_update():
+    async def run():
+        manager = _build_live_manager()
+        calls = []
+
+        async def update_data():
+            calls.append("update_data")
+
+        manager.update_data = update_data
+        dispatcher_send = MagicMock(side_effect=lambda *args: calls.append(args))
+        with patch.object(jellyfin, "async_dispatcher_send", dispatcher_send):
+            await manager._async_refresh_data()
+
+        assert calls == ["update_data", (manager.hass, manager.data_updated_signal)]
+        assert manager.data_updated_signal == f"{jellyfin.SIGNAL_DATA_UPDATED}_http://server"
+
+    asyncio.run(run())
+
+
+def test_library_event_burst_goes_through_one_debouncer():
+    async def run():
+        with patch.object(jellyfin, "Debouncer") as debouncer_cls:
+            manager = _build_live_manager()
+        manager.update_data = MagicMock()
+
+        debouncer_cls.assert_called_once()
+        kwargs = debouncer_cls.call_args.kwargs
+        assert kwargs["function"] == manager._async_refresh_data
+        assert kwargs["cooldown"] == jellyfin._SENSOR_REFRESH_COOLDOWN
+        assert kwargs["immediate"] is True
+
+        for event in ("LibraryChanged", "UserDataChanged", "LibraryChanged"):
+            manager._handle_event(event, {})
+        await asyncio.sleep(0)
+
+        debouncer = debouncer_cls.return_value
+        assert debouncer.async_schedule_call.call_count == 3
+        manager.update_data.assert_not_called()
+
+    asyncio.run(run())
+
+
+def test_stream_url_prefers_direct_stream_over_higher_bitrate():
+    async def run():
+        manager = _build_live_manager()
+        manager.get_play_info = AsyncMock(
+            return_value={
+                "MediaSources": [
+                    {
+                        "Id": "transcode",
+                        "SupportsDirectStream": False,
+                        "SupportsTranscoding": True,
+                        "Bitrate": 80_000_000,
+                        "TranscodingUrl": "/videos/item/master.m3u8",
+                        "TranscodingContainer": "ts",
+                    },
+                    {
+                        "Id": "direct",
+                        "SupportsDirectStream": True,
+                        "SupportsTranscoding": True,
+                        "Bitrate": 8_000_000,
+                        "Container": "mkv",
+                    },
+                ]
+            }
+        )
+
+        url, mimetype, _ = await manager.get_stream_url("item", "movie")
+
+        assert url == (
+            "http://server/Videos/item/stream?static=true"
+            "&MediaSourceId=direct&api_key=token"
+        )
+        assert mimetype == "video/mkv"
+
+    asyncio.run(run())
+
+
+def test_stream_url_rejects_unplayable_sources():
+    async def run():
+        manager = _build_live_manager()
+        manager.get_play_info = AsyncMock(
+            return_value={
+                "MediaSources": [
+                    {"Id": "a", "SupportsDirectStream": False, "SupportsTranscoding": True},
+                    {
+                        "Id": "b",
+                        "SupportsDirectStream": False,
+                        "SupportsTranscoding": False,
+                        "Bitrate": 0,
+                    },
+                ]
+            }
+        )
+
+        assert await manager.get_stream_url("item", "movie") == (None, None, None)
+
+    asyncio.run(run())
+
+
+def _config_entry(data, options):
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = data
+    entry.options = options
+    return entry
+
+
+def test_update_listener_reloads_only_on_config_change():
+    async def run():
+        data = {"url": "http://server", "api_key": "key", "generate_upcoming": False}
+        options = {"generate_upcoming": True}
+        hass = MagicMock()
+        hass.config_entries.async_reload = AsyncMock()
+        hass.data = {
+            jellyfin.DOMAIN: {
+                "http://server": {"config_key": frozenset({**data, **options}.items())}
+            }
+        }
+
+        # Setup folding the options into data must not reload the entry again
+        await jellyfin._update_listener(hass, _config_entry({**data, **options}, {}))
+        await jellyfin._update_listener(hass, _config_entry(data, options))
+        hass.config_entries.async_reload.assert_not_called()
+
+        await jellyfin._update_listener(
+            hass, _config_entry(data, {**options, "verify_ssl": False})
+        )
+        hass.config_entries.async_reload.assert_awaited_once_with("entry")
+
+    asyncio.run(run())
@@ -0,0 +1,44 @@
+import importlib
+from unittest.mock import MagicMock
+
+from integration_stubs import load_integration
+
+jellyfin = load_integration()
+media_player = importlib.import_module("custom_components.jellyfin.media_player")
+models = importlib.import_module("custom_components.jellyfin.models")
+
+
+def _build_player(now_playing):
+    session = models.SessionInfoDto.model_validate(
+        {
+            "UserId": "user",
+            "LastActivityDate": "2024-01-01T00:00:00Z",
+            "LastPlaybackCheckIn": "2024-01-01T00:00:00Z",
+            "IsActive": True,
+            "SupportsMediaControl": True,
+            "SupportsRemoteControl": True,
+            "HasCustomDeviceName": True,
+            "DeviceName": "Living Room",
+            "NowPlayingItem": now_playing,
+        }
+    )
+    manager = MagicMock()
+    manager.devices = {
+        "device": jellyfin.JellyfinDevice(session, manager, "Living Room.user")
+    }
+    return media_player.JellyfinMediaPlayer(manager, "device")
+
+
+def test_media_artist_is_first_artist():
+    player = _build_player({"Id": "track", "Type": "Audio", "Artists": ["Artist A", "Artist B"]})
+
+    assert player.media_artist == "Artist A"
+
+
+def test_media_artist_without_artists_is_none():
+    for now_playing in (
+        {"Id": "track", "Type": "Audio"},
+        {"Id": "track", "Type": "Audio", "Artists": []},
+        None,
+    ):
+        assert _build_player(now_playing).media_artist is None